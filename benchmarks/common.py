@@ -0,0 +1,39 @@
+"""
+Gate table and timing loop shared by the backend benchmarks.
+"""
+
+import time
+
+
+GATES = {
+    "X": lambda computer, qubit: computer.X(qubit),
+    "Y": lambda computer, qubit: computer.Y(qubit),
+    "Z": lambda computer, qubit: computer.Z(qubit),
+    "H": lambda computer, qubit: computer.H(qubit),
+    "R": lambda computer, qubit: computer.R(qubit, 0.5),
+    "SqrtNOT": lambda computer, qubit: computer.SqrtNOT(qubit)
+}
+
+
+def benchmark(computer, qubits, gate, repeat):
+    """
+    Applies :param gate :param repeat times, cycling through every qubit of the register. Backends that hold the
+    register in a file (with flush) write it back before the clock stops, so their I/O is included.
+
+    :param computer: quantum computer backend (object)
+    :param qubits: number of qubits in the register (integer)
+    :param gate: key of GATES (string)
+    :param repeat: number of gates applied (integer)
+    :return: seconds per gate (float)
+    """
+
+    apply = GATES[gate]
+
+    start = time.perf_counter()
+    for index in range(repeat):
+        apply(computer, index % qubits + 1)
+
+    if hasattr(computer, "flush"):
+        computer.flush()
+
+    return (time.perf_counter() - start) / repeat
@@ -0,0 +1,43 @@
+"""
+Per-gate I/O throughput of the out-of-core memmap backend.
+
+Usage:
+  memmap.py [--min=<qubits>] [--max=<qubits>] [--repeat=<gates>] [--chunk=<amplitudes>] [--directory=<directory>]
+            [--precision=<precision>]
+
+Options:
+  --min=<qubits>            Smallest register [default: 20].
+  --max=<qubits>            Largest register [default: 28].
+  --repeat=<gates>          Gates applied per measurement, spread over every qubit [default: 10].
+  --chunk=<amplitudes>      Amplitude pairs processed at once [default: 1048576].
+  --directory=<directory>   Directory of the statevector file (default: the temporary directory).
+  --precision=<precision>   Precision of the amplitudes: single or double [default: double].
+"""
+
+from docopt import docopt
+
+from common import GATES, benchmark
+from qasm.bridge.computer.MemmapComputer import MemmapComputer
+
+
+def main():
+    options = docopt(__doc__)
+    repeat = int(options["--repeat"])
+
+    print("{0:>6} {1:>8} {2:>10} {3:>12} {4:>12}".format("qubits", "gate", "file MB", "ms/gate", "MB/s"))
+
+    for qubits in range(int(options["--min"]), int(options["--max"]) + 1):
+        computer = MemmapComputer(qubits, options["--precision"], options["--directory"], int(options["--chunk"]))
+        size = computer.get_size() / (1 << 20)
+
+        for gate in GATES:
+            seconds = benchmark(computer, qubits, gate, repeat)
+            print("{0:>6} {1:>8} {2:>10.0f} {3:>12.2f} {4:>12.1f}".format(
+                qubits, gate, size, seconds * 1e3, size / seconds
+            ))
+
+        del computer
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Per-gate throughput of the native statevector backend.
+
+Usage:
+  statevector.py [--min=<qubits>] [--max=<qubits>] [--repeat=<gates>] [--precision=<precision>]
+
+Options:
+  --min=<qubits>            Smallest register [default: 10].
+  --max=<qubits>            Largest register [default: 25].
+  --repeat=<gates>          Gates applied per measurement, spread over every qubit [default: 50].
+  --precision=<precision>   Precision of the amplitudes: single or double [default: double].
+"""
+
+from docopt import docopt
+
+from common import GATES, benchmark
+from qasm.bridge.computer.StatevectorComputer import StatevectorComputer
+
+
+def main():
+    options = docopt(__doc__)
+    repeat = int(options["--repeat"])
+
+    print("{0:>6} {1:>8} {2:>14} {3:>12} {4:>14}".format("qubits", "gate", "gates/s", "us/gate", "ns/amplitude"))
+
+    for qubits in range(int(options["--min"]), int(options["--max"]) + 1):
+        computer = StatevectorComputer(qubits, precision=options["--precision"])
+
+        for gate in GATES:
+            seconds = benchmark(computer, qubits, gate, repeat)
+            print("{0:>6} {1:>8} {2:>14.1f} {3:>12.2f} {4:>14.3f}".format(
+                qubits, gate, 1 / seconds, seconds * 1e6, seconds * 1e9 / (1 << qubits)
+            ))
+
+
+if __name__ == "__main__":
+    main()
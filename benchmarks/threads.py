@@ -0,0 +1,51 @@
+"""
+Scaling of the threaded statevector backend from 1 to N threads.
+
+Usage:
+  threads.py [--min=<qubits>] [--max=<qubits>] [--threads=<threads>] [--repeat=<gates>] [--precision=<precision>]
+
+Options:
+  --min=<qubits>            Smallest register [default: 20].
+  --max=<qubits>            Largest register [default: 28].
+  --threads=<threads>       Largest number of threads (default: number of cores).
+  --repeat=<gates>          Gates applied per measurement, spread over every qubit [default: 20].
+  --precision=<precision>   Precision of the amplitudes: single or double [default: double].
+"""
+
+import os
+
+from docopt import docopt
+
+from common import GATES, benchmark
+from qasm.bridge.computer.StatevectorComputer import StatevectorComputer
+
+
+def main():
+    options = docopt(__doc__)
+    repeat = int(options["--repeat"])
+
+    maximum = int(options["--threads"] or os.cpu_count())
+    counts = sorted({1 << power for power in range(maximum.bit_length())} | {maximum})
+
+    print("{0:>6} {1:>8} {2:>8} {3:>12} {4:>10}".format("qubits", "threads", "gate", "ms/gate", "speedup"))
+
+    for qubits in range(int(options["--min"]), int(options["--max"]) + 1):
+        serial = {}
+
+        for threads in counts:
+            computer = StatevectorComputer(qubits, precision=options["--precision"], threads=threads)
+            computer.X(1)
+
+            for gate in GATES:
+                seconds = benchmark(computer, qubits, gate, repeat)
+                serial.setdefault(gate, seconds)
+
+                print("{0:>6} {1:>8} {2:>8} {3:>12.2f} {4:>10.2f}".format(
+                    qubits, threads, gate, seconds * 1e3, serial[gate] / seconds
+                ))
+
+            del computer
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,31 @@ Quantum Assembly (QASM)
 Usage:
   qasm config setup
   qasm config show
-  qasm execute <file>
+  qasm execute <file>... [--stream [--validate] | --no-cache] [--jobs=<jobs>] [--backend=<backend>]
+                  [--opt-level=<level>] [--shots=<shots>] [--sweep=<bindings>] [--precision=<precision>]
+                  [--threads=<threads>] [--output=<output>] [--checkpoint-every=<instructions>] [--resume]
 
 Options:
   -h --help                 Show this screen.
   --version                 Show version.
+  --stream                  Lex, parse and execute the program as a pipeline without loading it into memory.
+  --validate                Check the whole program for errors before a streamed execution starts.
+  --no-cache                Do not read or write the compiled program cache.
+  --jobs=<jobs>             Number of processes used to execute many programs, or to lex and parse a large
+                            program [default: 1].
+  --backend=<backend>       Quantum computer backend: external, statevector, sparse, product, memmap or
+                            shared (default: config, else external).
+  --opt-level=<level>       0: no optimisation, 1: peephole rewrites and gate fusion [default: 0].
+  --shots=<shots>           Run the program this many times and print a histogram of the measurements.
+  --sweep=<bindings>        Bind parameters to a value or to a range, e.g. theta=0:6.28:1000,phi=0.5.
+  --precision=<precision>   Precision of the statevector, memmap and shared amplitudes: single or double
+                            (default: config, else double).
+  --threads=<threads>       Number of threads applying each gate of a large statevector [default: 1].
+  --output=<output>         Format of the results, text, jsonl, raw or npy, and optionally the file they are
+                            written to, e.g. npy:results.npy [default: text].
+  --checkpoint-every=<instructions>  Write the statevector to disk every this many instructions (statements
+                            when streamed).
+  --resume                  Resume from the latest checkpoint of the program, appending to its output.
 
 Help:
   For help using this client, please see https://github.com/johnyob/QASM
@@ -29,13 +49,13 @@ class Client:
         """
         Client Class.
         Retrieves options from docopt. Options are then filtered using data stored in commands.json.
-        Command is then imported and instantiated.
+        Command is then imported and instantiated. Command words are not passed to the command, flags are.
         """
 
         self._options = docopt(__doc__, version=__version__)
         self._arguments = {
             k: v for k, v in self._options.items()
-            if not isinstance(v, bool)
+            if not isinstance(v, bool) or k.startswith("--")
         }
 
         commands_json = json.loads(read_file(COMMANDS_JSON))
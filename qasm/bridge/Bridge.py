@@ -1,27 +1,142 @@
+from collections import Counter
+from importlib import import_module
+
+import numpy
+
 from qasm.parser.Statement import StatementVisitor
+from qasm.helpers.Constants import BACKENDS
 from qasm.error.BridgeError import BridgeError
-from quantum_computer import Computer
+from qasm.lexer.TokenType import TokenType
+from qasm.lexer.Token import Token
+from qasm.compiler.Tape import Tape, UNITARY
+from qasm.bridge.sink.TextSink import TextSink
+
+
+TAPE_BLOCK = 1 << 16
 
 
 class Bridge(StatementVisitor):
 
-    def __init__(self, statements, qubits):
+    def __init__(self, statements, qubits, backend="external", shots=None, bindings=None, precision=None,
+                 threads=None, sink=None, checkpoint=None):
         """
         Bridge constructor.
         Bridge for qasm.parser.Statement.Statement objects.
         Constructs a interface between the ASM and the Quantum Computer
 
-        :param statements: list of statements produced by the parser (list)
+        :param statements: statements produced by the parser, or the tape they were lowered to
+                           (iterable | qasm.compiler.Tape.Tape)
         :param registers: number of qubits in quantum computer (integer)
+        :param backend: name of the quantum computer backend, a key of BACKENDS (string)
+        :param shots: number of times the program is run, printing a histogram of the measurements instead of each
+                      measurement; only supported for tapes (integer)
+        :param bindings: values of the parameters keyed by name; a parameter swept over an array of values runs the
+                         program once per value, as a batch on the backend, and labels every measurement (dict)
+        :param precision: floating point precision of the backend, a key of PRECISIONS; only supported by backends
+                          with get_precision (string)
+        :param threads: number of threads applying each gate; only supported by backends with get_threads (integer)
+        :param sink: result sink the measurements are written to (default: a text sink on standard output)
+                     (qasm.bridge.sink.TextSink.TextSink)
+        :param checkpoint: checkpoints the register is periodically written to and resumed from; only supported by
+                           backends with get_state, and not when each shot reruns the program
+                           (qasm.bridge.Checkpoint.Checkpoint)
         """
 
         self._statements = statements
 
         self._qubits = qubits
-        self._quantum_computer = Computer(qubits)
+        self._computer = Bridge.get_backend(backend)
+
+        self._bindings = bindings or {}
+        self._batch = next((len(value) for value in self._bindings.values() if numpy.ndim(value)), None)
+        self._precision = precision
+        self._threads = threads
+
+        self._sink = sink or TextSink()
+        self._sink.set_register(qubits, None if self._batch is None else [
+            {name: value[row] if numpy.ndim(value) else value for name, value in self._bindings.items()}
+            for row in range(self._batch)
+        ])
+
+        self._quantum_computer = None
+
+        self._checkpoint = checkpoint if hasattr(self._computer, "get_state") else None
+        if self._checkpoint and self._checkpoint.get_every():
+            self._sink.set_deferred(True)
+
+        self._shots = shots
+        self._sampling = False
+        self._observations = []
+        self._histogram = Counter()
+
+        self._drift = None
 
         self._errors = []
 
+    @staticmethod
+    def get_backend(name):
+        """
+        Imports the quantum computer backend :param name.
+        Backends are imported on demand, so the external simulator is only required when it is used.
+
+        :param name: a key of BACKENDS (string)
+        :return: (type)
+        """
+
+        module, computer = BACKENDS[name]
+        return getattr(import_module(module), computer)
+
+    def _allocate(self):
+        """
+        Allocates the quantum register stored in _quantum_computer.
+        If the backend can not hold a register of _qubits qubits (e.g. it does not fit in memory, or on disk) -> bridge
+        error raised.
+
+        :return: (None)
+        """
+
+        try:
+            self._quantum_computer = self._new_computer()
+        except (ValueError, OverflowError, MemoryError, OSError):
+            raise BridgeError(
+                Token(TokenType.QUBIT, "q{0}".format(self._qubits), self._qubits, 0),
+                "Register can not be allocated on this backend"
+            )
+
+    def _new_computer(self):
+        """
+        Returns a new quantum computer from the backend, with a register per binding when parameters are swept
+
+        :return: (object)
+        """
+
+        options = {
+            name: value for name, value in (("precision", self._precision), ("threads", self._threads))
+            if value is not None
+        }
+
+        if self._batch is None:
+            return self._computer(self._qubits, **options)
+
+        return self._computer(self._qubits, self._batch, **options)
+
+    def _bind(self, phi):
+        """
+        Returns the angle of phase shift operand :param phi.
+        If :param phi is a parameter without a value -> bridge error raised.
+
+        :param phi: (qasm.lexer.Token.Token)
+        :return: (float | numpy.ndarray)
+        """
+
+        if phi.get_type() != TokenType.PARAMETER:
+            return phi.get_literal()
+
+        if phi.get_literal() not in self._bindings:
+            raise BridgeError(phi, "Parameter is not bound")
+
+        return self._bindings[phi.get_literal()]
+
     def _validate_qubit(self, qubit):
         """
         If :param qubit out of index range -> bridge error raised.
@@ -96,7 +211,7 @@ class Bridge(StatementVisitor):
         qubit = statement.get_qubit()
         self._validate_qubit(qubit)
 
-        self._quantum_computer.R(qubit.get_literal(), statement.get_phi().get_literal())
+        self._quantum_computer.R(qubit.get_literal(), self._bind(statement.get_phi()))
 
     def visit_sqrt_not_statement(self, statement):
         """
@@ -119,24 +234,314 @@ class Bridge(StatementVisitor):
         :return: (None)
         """
 
-        print(self._quantum_computer.measure())
+        self._measure()
+
+    def _measure(self):
+        """
+        Observes the quantum register stored in _quantum_computer and writes the result to the sink.
+        In shots mode the result is recorded for the histogram instead, or every shot is sampled at once.
+
+        :return: (None)
+        """
+
+        self._check_norm()
+
+        if self._shots is None:
+            for row, observation in self._rows(self._quantum_computer.measure()):
+                self._sink.write_measurement(row, observation)
+        elif self._sampling:
+            for row, observations in self._rows(self._quantum_computer.sample(self._shots)):
+                for observation, count in observations:
+                    self._histogram[(row, (observation,))] += count
+        else:
+            self._observations.append(self._quantum_computer.measure())
+
+    def _rows(self, result):
+        """
+        Returns the (binding, result) pairs of :param result, a result of the backend for every register of a batch or
+        for the single register
+
+        :param result: (object)
+        :return: (iterable)
+        """
+
+        if self._batch is None:
+            return [(0, result)]
+
+        return enumerate(result)
 
     def execute(self):
         """
         Executes statements stored in _statements.
         If a bridge (or error from the quantum computer) error occurs during the execution of statements, then the
         error is appended to the internal errors list and the program is halted.
+        The results buffered by the sink are written out in either case.
+        The register is allocated first, so a backend that can not hold it is reported as a bridge error as well.
+        With a checkpoint the execution resumes from it, and its checkpoints are removed once it has completed.
 
         :return: (None)
         """
 
         try:
-            for statement in self._statements:
-                self._execute_statement(statement)
+            self._allocate()
+            begin = self._resume()
+
+            if self._shots is not None:
+                self._execute_shots(self._statements, begin)
+            elif isinstance(self._statements, Tape):
+                self._execute_tape(self._statements, begin)
+            else:
+                self._execute_statements(self._statements, begin)
+
+            self._check_norm()
+
+            if self._checkpoint:
+                self._checkpoint.remove()
         except (BridgeError, Exception) as error:
             self._error(error)
+
+        self._sink.flush()
+
+    def _check_norm(self):
+        """
+        Records the drift of the norm of the register stored in _quantum_computer from 1, for backends that report it.
+        The register is checked before every measurement, which restores the norm, and after the program (unless it
+        failed), so get_drift returns the largest drift of the execution.
+
+        :return: (None)
+        """
+
+        if hasattr(self._quantum_computer, "get_drift"):
+            self._drift = max(self._drift or 0.0, self._quantum_computer.get_drift())
+
+    def get_drift(self):
+        """
+        Returns the largest drift of the norm of the register from 1 during the execution, or None if the backend
+        does not report it
+
+        :return: (float)
+        """
+
+        return self._drift
+
+    def _resume(self):
+        """
+        Restores the register stored in _quantum_computer from the checkpoint the execution resumes from, and removes
+        the results written to the output file after it, which the execution writes again.
+        Returns the index of the first instruction to execute.
+
+        :return: (integer)
+        """
+
+        if not self._checkpoint:
+            return 0
+
+        begin = self._checkpoint.restore(self._quantum_computer)
+        if begin and self._checkpoint.get_offset() is not None:
+            self._sink.truncate(self._checkpoint.get_offset())
+
+        return begin
+
+    def _execute_statements(self, statements, begin):
+        """
+        Executes :param statements from statement :param begin on, writing a checkpoint every few statements
+
+        :param statements: (iterable)
+        :param begin: index of the first statement to execute (integer)
+        :return: (None)
+        """
+
+        every = self._checkpoint.get_every() if self._checkpoint else None
+
+        for index, statement in enumerate(statements):
+            if index < begin:
+                continue
+
+            self._execute_statement(statement)
+
+            if every and (index + 1) % every == 0:
+                self._store(index + 1)
+
+    def _execute_tape(self, tape, begin=0):
+        """
+        Executes the instructions stored on :param tape from instruction :param begin on.
+        Qubit indices and parameters are validated for the whole tape at once; the instructions before the first
+        invalid instruction are executed and then a bridge error is raised for it.
+
+        :param tape: (qasm.compiler.Tape.Tape)
+        :param begin: index of the first instruction to execute (integer)
+        :return: (None)
+        """
+
+        end, error = self._validate_tape(tape)
+        self._execute_valid(tape, end, begin, True)
+
+        if error:
+            raise error
+
+    def _execute_shots(self, tape, begin=0):
+        """
+        Runs the instructions stored on :param tape _shots times and writes a histogram of the measurements.
+        If the program measures the register at most once and the backend can sample, the gates are applied once and
+        every shot is drawn from the final distribution. Otherwise each shot reruns the program on a register reset to
+        |0...0> (or on a new one if the backend can not reset it), since a measurement collapses the register; such
+        runs are not checkpointed.
+
+        :param tape: (qasm.compiler.Tape.Tape)
+        :param begin: index of the first instruction to execute when sampling (integer)
+        :return: (None)
+        """
+
+        end, error = self._validate_tape(tape)
+        measurements = numpy.count_nonzero(tape.get_instructions()["opcode"][:end] == TokenType.MEASURE.value)
+
+        if measurements == 0 or (measurements == 1 and hasattr(self._quantum_computer, "sample")):
+            self._sampling = True
+            self._execute_valid(tape, end, begin, True)
+        else:
+            for _ in range(self._shots):
+                if hasattr(self._quantum_computer, "reset"):
+                    self._quantum_computer.reset()
+                else:
+                    self._quantum_computer = self._new_computer()
+
+                self._observations = []
+
+                self._execute_valid(tape, end)
+
+                shot = tuple(self._observations) if self._batch is None else list(zip(*self._observations))
+                for row, observations in self._rows(shot):
+                    self._histogram[(row, tuple(observations))] += 1
+
+        for (row, observations), count in sorted(self._histogram.items()):
+            self._sink.write_histogram(row, observations, count)
+
+        if error:
+            raise error
+
+    def _validate_tape(self, tape):
+        """
+        Validates the qubit indices and parameters of the whole of :param tape at once.
+        Returns the index of the first instruction with an out of range qubit or an unbound parameter (or the length
+        of the tape) and the bridge error for it (or None).
+
+        :param tape: (qasm.compiler.Tape.Tape)
+        :return: (tuple)
+        """
+
+        instructions = tape.get_instructions()
+        qubits = instructions["qubit"]
+
+        invalid = (instructions["opcode"] != TokenType.MEASURE.value) & ((qubits < 1) | (qubits > self._qubits))
+        unbound = [
+            index + 1 for index, name in enumerate(tape.get_parameters()) if name not in self._bindings
+        ]
+
+        if unbound:
+            invalid |= (instructions["opcode"] == TokenType.R.value) & numpy.isin(instructions["operand"], unbound)
+
+        invalid = numpy.flatnonzero(invalid)
+        if not len(invalid):
+            return len(instructions), None
+
+        end = int(invalid[0])
+        if 1 <= int(qubits[end]) <= self._qubits:
+            return end, BridgeError(tape.get_parameter(end), "Parameter is not bound")
+
+        return end, BridgeError(tape.get_qubit(end), "Qubit index out of range")
+
+    def _execute_valid(self, tape, end, begin=0, checkpoints=False):
+        """
+        Executes the instructions stored on :param tape from :param begin to :param end, in blocks.
+        With :param checkpoints the blocks also end every few instructions, where a checkpoint is written.
+
+        :param tape: (qasm.compiler.Tape.Tape)
+        :param end: index of the first invalid instruction (integer)
+        :param begin: index of the first instruction to execute (integer)
+        :param checkpoints: whether to write checkpoints (boolean)
+        :return: (None)
+        """
+
+        instructions = tape.get_instructions()
+        parameters = [self._bindings.get(name, None) for name in tape.get_parameters()]
+
+        every = self._checkpoint.get_every() if checkpoints and self._checkpoint else None
+
+        bounds = set(range(begin, end, TAPE_BLOCK))
+        if every:
+            bounds.update(range((begin // every + 1) * every, end, every))
+
+        starts = sorted(bounds)
+        for start, stop in zip(starts, starts[1:] + [end]):
+            self._execute_instructions(instructions[start:stop], tape.get_unitaries(), parameters)
+
+            if every and stop % every == 0 and stop < end:
+                self._store(stop)
+
+    def _store(self, index):
+        """
+        Writes a checkpoint of the register stored in _quantum_computer before instruction :param index.
+        The results of the instructions before it are written out first and the checkpoint records where they end in
+        the output file, so a resumed execution removes the results written after it instead of repeating them. The
+        sink only writes them at checkpoints, so none are lost either. Results written to standard output after the
+        latest checkpoint are printed again on resume. A histogram is only written once the program has completed, so
+        none is written after a sampled measurement.
+
+        :param index: (integer)
+        :return: (None)
+        """
+
+        if self._histogram:
+            return
+
+        self._sink.flush()
+        self._checkpoint.store(index, self._quantum_computer, self._sink.get_offset())
+
+    def _execute_instructions(self, instructions, unitaries, parameters):
+        """
+        Applies a block of tape instructions to the quantum register stored in _quantum_computer.
+        Dispatches on the opcode column directly instead of visiting statement objects. Backends that can apply a run
+        of gates at once are given every run between two measurements instead.
+
+        :param instructions: structured array with dtype qasm.compiler.Tape.TAPE_DTYPE (numpy.ndarray)
+        :param unitaries: matrices of the UNITARY instructions (numpy.ndarray)
+        :param parameters: values of the parameters of the tape (list)
+        :return: (None)
+        """
+
+        computer = self._quantum_computer
+
+        if hasattr(computer, "apply"):
+            start = 0
+            for end in numpy.flatnonzero(instructions["opcode"] == TokenType.MEASURE.value).tolist():
+                computer.apply(instructions[start:end], parameters)
+                self._measure()
+                start = end + 1
+
+            computer.apply(instructions[start:], parameters)
             return
 
+        gates = {
+            TokenType.X.value: computer.X,
+            TokenType.Y.value: computer.Y,
+            TokenType.Z.value: computer.Z,
+            TokenType.H.value: computer.H,
+            TokenType.SQRT_NOT.value: computer.SqrtNOT
+        }
+
+        for opcode, qubit, angle, operand in zip(
+            instructions["opcode"].tolist(), instructions["qubit"].tolist(), instructions["angle"].tolist(),
+            instructions["operand"].tolist()
+        ):
+            if opcode == TokenType.R.value:
+                computer.R(qubit, parameters[operand - 1] if operand else angle)
+            elif opcode == TokenType.MEASURE.value:
+                self._measure()
+            elif opcode == UNITARY:
+                computer.U(qubit, unitaries[operand])
+            else:
+                gates[opcode](qubit)
+
     def _execute_statement(self, statement):
         """
         Executes :param statement using public AST (Abstract Syntax Tree) traversal method.
@@ -0,0 +1,173 @@
+import tempfile
+import glob
+import os
+
+import numpy
+
+from qasm.helpers.Constants import CHECKPOINT_DIRECTORY, USER_CHECKPOINT_DIRECTORY
+from qasm.helpers.Util import writable_directory
+
+
+class Checkpoint:
+    """
+    Checkpoint Class
+    On-disk checkpoints of a long running execution, so that it can be resumed after it was interrupted. A checkpoint
+    holds the statevector of the register, written with numpy.save (no pickling), and is named by a hash of the
+    program and of its options, by the index of the first instruction (or statement) it has not executed yet and by
+    the offset of the end of the results written to the output file by then.
+    """
+
+    def __init__(self, key, every=None, resume=False, directory=None):
+        """
+        Checkpoint constructor
+
+        :param key: hash of the program and of the options its execution depends on (string)
+        :param every: number of instructions executed between two checkpoints, or None to write none (integer)
+        :param resume: whether to resume from the latest checkpoint of :param key (boolean)
+        :param directory: directory holding the checkpoints (default: CHECKPOINT_DIRECTORY, inside the package, or
+                          USER_CHECKPOINT_DIRECTORY if the package can not be written to) (string)
+        """
+
+        self._key = key
+        self._every = every
+        self._directory = directory or writable_directory(CHECKPOINT_DIRECTORY, USER_CHECKPOINT_DIRECTORY)
+
+        self._resumed, self._offset = self._latest() if resume else (None, None)
+
+    def get_every(self):
+        """
+        Returns the number of instructions executed between two checkpoints, or None if none are written
+
+        :return: (integer)
+        """
+
+        return self._every
+
+    def get_resumed(self):
+        """
+        Returns the index of the instruction the execution resumes from, or None if it starts from the beginning
+
+        :return: (integer)
+        """
+
+        return self._resumed
+
+    def get_offset(self):
+        """
+        Returns the offset of the end of the results written to the output file before the checkpoint the execution
+        resumes from, or None if they were written to standard output or it starts from the beginning
+
+        :return: (integer)
+        """
+
+        return self._offset
+
+    def restore(self, computer):
+        """
+        Restores the register of :param computer from the checkpoint the execution resumes from.
+        The statevector is memory-mapped, so backends holding it out of core restore it without loading it at once.
+        Returns the index of the first instruction to execute.
+
+        :param computer: quantum computer with get_state and set_state (object)
+        :return: (integer)
+        """
+
+        if self._resumed is None:
+            return 0
+
+        computer.set_state(numpy.load(
+            self._path(self._resumed, self._offset), mmap_mode="r", allow_pickle=False
+        ))
+        return self._resumed
+
+    def store(self, index, computer, offset=None):
+        """
+        Writes the register of :param computer before instruction :param index, then removes the older checkpoints.
+        The statevector is written to a temporary file which is then atomically renamed, so an interrupted write
+        never replaces the latest checkpoint with a partial file.
+
+        :param index: index of the first instruction not executed yet (integer)
+        :param computer: quantum computer with get_state and set_state (object)
+        :param offset: offset of the end of the results written to the output file, if any (integer)
+        :return: (None)
+        """
+
+        path = self._path(index, offset)
+
+        os.makedirs(self._directory, exist_ok=True)
+
+        descriptor, temporary = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                numpy.save(file, computer.get_state(), allow_pickle=False)
+                file.flush()
+                os.fsync(file.fileno())
+
+            os.replace(temporary, path)
+        except BaseException:
+            self._remove(temporary)
+            raise
+
+        for other in self._paths():
+            if other != path:
+                self._remove(other)
+
+    def remove(self):
+        """
+        Removes every checkpoint of the execution, once it has completed
+
+        :return: (None)
+        """
+
+        for path in self._paths():
+            self._remove(path)
+
+    def _latest(self):
+        """
+        Returns the index and the output offset of the latest checkpoint of the execution, or None and None if there
+        is none
+
+        :return: (tuple)
+        """
+
+        checkpoints = []
+        for path in self._paths():
+            fields = os.path.basename(path).split(".")[1:-1]
+            if 1 <= len(fields) <= 2 and all(field.isdigit() for field in fields):
+                checkpoints.append((int(fields[0]), int(fields[1]) if len(fields) == 2 else None))
+
+        return max(checkpoints, key=lambda checkpoint: checkpoint[0], default=(None, None))
+
+    def _paths(self):
+        """
+        Returns the paths of every checkpoint of the execution
+
+        :return: (list)
+        """
+
+        return glob.glob(os.path.join(self._directory, "{0}.*.npy".format(self._key)))
+
+    def _path(self, index, offset):
+        """
+        Returns the path of the checkpoint before instruction :param index, with output offset :param offset
+
+        :param index: (integer)
+        :param offset: (integer)
+        :return: (string)
+        """
+
+        name = "{0}.{1}".format(self._key, index) if offset is None else "{0}.{1}.{2}".format(self._key, index, offset)
+        return os.path.join(self._directory, "{0}.npy".format(name))
+
+    def _remove(self, path):
+        """
+        Removes :param path, ignoring files that have already been removed
+
+        :param path: (string)
+        :return: (None)
+        """
+
+        try:
+            os.remove(path)
+        except OSError:
+            pass
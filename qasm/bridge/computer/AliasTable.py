@@ -0,0 +1,58 @@
+import numpy
+
+
+class AliasTable:
+
+    def __init__(self, probabilities):
+        """
+        AliasTable constructor.
+        Alias table (Walker's alias method) of the discrete distribution :param probabilities, from which any number
+        of outcomes is drawn in O(1) each. Each of the n cells holds the probability of keeping its own outcome and
+        the alias outcome drawn otherwise, so a draw is a uniform cell and one comparison.
+
+        The table is built in O(n log n) without a Python loop. With q = n p, the cells with q < 1 (small) have a
+        deficit 1 - q and the others (large) an excess q - 1, which add up to the same total. Laid end to end, the
+        deficits of the small cells are covered by the excesses of the large cells in order: a small cell aliases
+        the large cell whose excess covers the start of its deficit. Once its excess is used up a large cell is
+        itself short of the deficit of the last small cell starting within it that spills over past its end, and
+        aliases the next large cell.
+
+        :param probabilities: probability of each outcome, up to normalisation (numpy.ndarray)
+        """
+
+        size = len(probabilities)
+        scaled = probabilities * (size / probabilities.sum(dtype=numpy.float64))
+
+        small = scaled < 1
+        smalls, larges = numpy.flatnonzero(small), numpy.flatnonzero(~small)
+
+        self._probability = numpy.minimum(scaled, 1)
+        self._alias = numpy.arange(size)
+
+        if len(smalls) and len(larges):
+            deficits = 1 - self._probability[smalls]
+            ends = numpy.cumsum(deficits)
+            starts = ends - deficits
+            excesses = numpy.cumsum(scaled[larges] - 1)
+
+            covering = numpy.cumsum(numpy.bincount(
+                numpy.searchsorted(starts, excesses, side="left"), minlength=len(smalls) + 1
+            )[:len(smalls)])
+            self._alias[smalls] = larges[numpy.minimum(covering, len(larges) - 1)]
+
+            spilling = numpy.searchsorted(starts, excesses[:-1], side="left") - 1
+            overflow = numpy.where(spilling >= 0, ends[spilling] - excesses[:-1], 0)
+            self._probability[larges[:-1]] = numpy.clip(1 - overflow, 0, 1)
+            self._alias[larges[:-1]] = larges[1:]
+
+    def draw(self, shots, random):
+        """
+        Draws :param shots outcomes in one vectorized pass
+
+        :param shots: (integer)
+        :param random: (numpy.random.Generator)
+        :return: (numpy.ndarray)
+        """
+
+        cells = random.integers(0, len(self._alias), shots)
+        return numpy.where(random.random(shots) < self._probability[cells], cells, self._alias[cells])
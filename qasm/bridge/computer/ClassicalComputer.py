@@ -0,0 +1,218 @@
+import math
+
+import numpy
+
+from qasm.lexer.TokenType import TokenType, KEYWORDS
+from qasm.lexer.Token import Token
+from qasm.compiler.Gates import phase
+from qasm.compiler.Tape import CLASSICAL, UNITARY
+from qasm.error.BridgeError import BridgeError
+
+
+class ClassicalComputer:
+
+    def __init__(self, qubits, batch=None):
+        """
+        ClassicalComputer constructor.
+        Native quantum computer backend for programs that never leave a computational basis state. X and Y flip a
+        qubit, while Z and R only change the global phase, so the register is stored as one integer bitmask and an
+        accumulated phase; no amplitudes are allocated and every measurement is deterministic.
+        Gates that create a superposition (H, SqrtNOT) are not supported; the front-end only selects this backend for
+        programs without them (see qasm.compiler.Tape.Tape.is_classical), and it can not be selected by the user.
+        Qubit 1 is the most significant bit of the bitmask (and the leftmost bit of a measurement).
+
+        :param qubits: number of qubits in the register (integer)
+        :param batch: number of registers simulated side by side, which all hold the same basis state (integer)
+        """
+
+        self._qubits = qubits
+        self._batch = batch
+
+        self._state = 0
+        self._phase = 1 + 0j
+
+    def get_batch(self):
+        """
+        Returns the number of registers simulated side by side, or None for a single register
+
+        :return: (integer)
+        """
+
+        return self._batch
+
+    def get_phase(self):
+        """
+        Returns the accumulated global phase
+
+        :return: (complex | numpy.ndarray)
+        """
+
+        return self._phase
+
+    def X(self, qubit):
+        """
+        Applies the pauli x gate to :param qubit
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        self._state ^= 1 << (self._qubits - qubit)
+
+    def Y(self, qubit):
+        """
+        Applies the pauli y gate to :param qubit
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        mask = 1 << (self._qubits - qubit)
+
+        self._phase *= -1j if self._state & mask else 1j
+        self._state ^= mask
+
+    def Z(self, qubit):
+        """
+        Applies the pauli z gate to :param qubit
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        if self._state & 1 << (self._qubits - qubit):
+            self._phase = -self._phase
+
+    def R(self, qubit, phi):
+        """
+        Applies the phase shift gate to :param qubit
+
+        :param qubit: (integer)
+        :param phi: angle of the phase shift, or one angle per register of the batch (float | numpy.ndarray)
+        :return: (None)
+        """
+
+        if self._state & 1 << (self._qubits - qubit):
+            self._phase = self._phase * (numpy.exp(1j * phi) if numpy.ndim(phi) else phase(phi))
+
+    def H(self, qubit):
+        """
+        The hadamard gate creates a superposition, which a bitmask can not hold -> ValueError raised.
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        raise ValueError("The hadamard gate leaves the computational basis")
+
+    def SqrtNOT(self, qubit):
+        """
+        The square root of not gate creates a superposition, which a bitmask can not hold -> ValueError raised.
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        raise ValueError("The square root of not gate leaves the computational basis")
+
+    def apply(self, instructions, parameters):
+        """
+        Applies a block of X, Y, Z and R tape instructions at once, without a Python step per gate.
+        A qubit's value at each gate is its value before the block, flipped by the X and Y gates that came before it
+        on that qubit (a running count per qubit, found by a stable sort on the qubit). The phases of the gates then
+        add up, and the state flips every qubit that had an odd number of X and Y gates.
+        If the block holds any other gate -> the gates before it are applied and a bridge error raised for it.
+
+        :param instructions: structured array with dtype qasm.compiler.Tape.TAPE_DTYPE (numpy.ndarray)
+        :param parameters: values of the parameters of the tape (list)
+        :return: (None)
+        """
+
+        if not len(instructions):
+            return
+
+        opcodes = instructions["opcode"]
+
+        invalid = numpy.flatnonzero(~numpy.isin(opcodes, CLASSICAL))
+        if len(invalid):
+            self.apply(instructions[:invalid[0]], parameters)
+            raise BridgeError(self._gate(instructions[invalid[0]]), "Gate leaves the computational basis")
+
+        qubits = instructions["qubit"].astype(numpy.intp)
+
+        y = opcodes == TokenType.Y.value
+        flips = ((opcodes == TokenType.X.value) | y).astype(numpy.intp)
+
+        order = numpy.argsort(qubits, kind="stable")
+        ordered = qubits[order]
+        before = numpy.cumsum(flips[order]) - flips[order]
+
+        flipped = numpy.empty_like(before)
+        flipped[order] = before - before[numpy.searchsorted(ordered, ordered)]
+
+        state = numpy.frombuffer(format(self._state, "0{0}b".format(self._qubits)).encode(), dtype=numpy.uint8) - 48
+        ones = (state[qubits - 1] ^ flipped & 1).astype(bool)
+
+        shifts = ones & (opcodes == TokenType.R.value)
+        operands = instructions["operand"][shifts]
+        angle = (
+            math.pi * numpy.count_nonzero(ones & (opcodes == TokenType.Z.value))
+            + math.pi / 2 * (numpy.count_nonzero(y & ~ones) - numpy.count_nonzero(y & ones))
+            + instructions["angle"][shifts][operands == 0].sum()
+        )
+
+        phase = numpy.exp(1j * angle)
+        for operand, count in zip(*numpy.unique(operands[operands > 0], return_counts=True)):
+            phase = phase * numpy.exp(1j * count * numpy.asarray(parameters[operand - 1]))
+
+        self._phase = self._phase * (phase if numpy.ndim(phase) else complex(phase))
+
+        toggled = numpy.bincount(qubits, weights=flips, minlength=self._qubits + 1)[1:].astype(numpy.uint8) & 1
+        self._state ^= int((toggled + 48).tobytes(), 2)
+
+    def _gate(self, instruction):
+        """
+        Returns a token for the gate of tape instruction :param instruction, for error reporting
+
+        :param instruction: row of a tape (numpy.void)
+        :return: (qasm.lexer.Token.Token)
+        """
+
+        opcode = int(instruction["opcode"])
+        if opcode == UNITARY:
+            return Token(None, "U", None, int(instruction["line"]))
+
+        type = TokenType(opcode)
+        lexeme = next(lexeme for lexeme, keyword in KEYWORDS.items() if keyword is type)
+
+        return Token(type, lexeme, None, int(instruction["line"]))
+
+    def measure(self):
+        """
+        Observes the register. The register is in a basis state, so the observation is certain and nothing collapses.
+        A batch of registers returns one observation per register.
+
+        :return: (string | list)
+        """
+
+        observation = "|psi> = |{0}>".format(format(self._state, "0{0}b".format(self._qubits)))
+
+        if self._batch is None:
+            return observation
+
+        return [observation] * self._batch
+
+    def sample(self, shots):
+        """
+        Observes the register :param shots times, without collapsing it
+
+        :param shots: number of observations (integer)
+        :return: observations and the number of times each was made (list)
+        """
+
+        observation = self.measure()
+
+        if self._batch is None:
+            return [(observation, shots)]
+
+        return [[(row, shots)] for row in observation]
@@ -0,0 +1,96 @@
+import math
+
+import numpy
+
+
+SQRT_HALF = 1 / math.sqrt(2)
+
+SQRT_NOT = numpy.array([
+    [0.5 + 0.5j, 0.5 - 0.5j],
+    [0.5 - 0.5j, 0.5 + 0.5j]
+])
+
+
+def pauli_x(zero, one):
+    """
+    Swaps the amplitudes of :param zero and :param one
+
+    :param zero: amplitudes where the qubit is 0 (numpy.ndarray)
+    :param one: amplitudes where the qubit is 1 (numpy.ndarray)
+    :return: (None)
+    """
+
+    swap = zero.copy()
+    zero[...] = one
+    one[...] = swap
+
+
+def pauli_y(zero, one):
+    """
+    Swaps the amplitudes of :param zero and :param one, multiplied by -i and i
+
+    :param zero: amplitudes where the qubit is 0 (numpy.ndarray)
+    :param one: amplitudes where the qubit is 1 (numpy.ndarray)
+    :return: (None)
+    """
+
+    swap = zero.copy()
+    numpy.multiply(one, -1j, out=zero)
+    numpy.multiply(swap, 1j, out=one)
+
+
+def pauli_z(zero, one):
+    """
+    Negates the amplitudes of :param one
+
+    :param zero: amplitudes where the qubit is 0 (numpy.ndarray)
+    :param one: amplitudes where the qubit is 1 (numpy.ndarray)
+    :return: (None)
+    """
+
+    numpy.negative(one, out=one)
+
+
+def hadamard(zero, one):
+    """
+    Replaces the amplitudes of :param zero and :param one with their normalised sum and difference
+
+    :param zero: amplitudes where the qubit is 0 (numpy.ndarray)
+    :param one: amplitudes where the qubit is 1 (numpy.ndarray)
+    :return: (None)
+    """
+
+    difference = zero - one
+    zero += one
+    zero *= SQRT_HALF
+    numpy.multiply(difference, SQRT_HALF, out=one)
+
+
+def phase_shift(zero, one, shift):
+    """
+    Multiplies the amplitudes of :param one by :param shift
+
+    :param zero: amplitudes where the qubit is 0 (numpy.ndarray)
+    :param one: amplitudes where the qubit is 1 (numpy.ndarray)
+    :param shift: (complex | numpy.ndarray)
+    :return: (None)
+    """
+
+    one *= shift
+
+
+def unitary(zero, one, a, b, c, d):
+    """
+    Multiplies the amplitude pairs of :param zero and :param one by the unitary [[a, b], [c, d]]
+
+    :param zero: amplitudes where the qubit is 0 (numpy.ndarray)
+    :param one: amplitudes where the qubit is 1 (numpy.ndarray)
+    :param a, b, c, d: entries of the unitary (complex)
+    :return: (None)
+    """
+
+    previous = zero.copy()
+    zero *= a
+    zero += b * one
+    one *= d
+    one += c * previous
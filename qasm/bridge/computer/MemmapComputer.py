@@ -0,0 +1,309 @@
+import tempfile
+import math
+
+import numpy
+
+from qasm.helpers.Constants import PRECISIONS, MEMMAP_CHUNK_SIZE
+from qasm.compiler.Gates import phase
+
+
+SQRT_HALF = 1 / math.sqrt(2)
+
+SQRT_NOT = numpy.array([
+    [0.5 + 0.5j, 0.5 - 0.5j],
+    [0.5 - 0.5j, 0.5 + 0.5j]
+])
+
+
+class MemmapComputer:
+
+    def __init__(self, qubits, precision="double", directory=None, chunk=MEMMAP_CHUNK_SIZE):
+        """
+        MemmapComputer constructor.
+        Native quantum computer backend holding the dense statevector in a numpy.memmap file on local disk instead of
+        in memory, so registers larger than the physical memory can be simulated. The file is anonymous (removed as
+        soon as the backend is closed) and is created in :param directory, by default the temporary directory.
+
+        Gates are applied chunk by chunk, in the order of the file: every chunk pairs at most :param chunk amplitudes
+        where the qubit is 0 with their partners where it is 1, which lie one stride of the qubit further on. Both are
+        streamed sequentially, so only O(chunk) amplitudes are ever held in memory and the pages of the file are read
+        and written once per gate. Measurements scan the file in chunks as well.
+        Qubit 1 is the most significant bit of a basis state index (and the leftmost bit of a measurement).
+
+        :param qubits: number of qubits in the register (integer)
+        :param precision: floating point precision of the amplitudes, a key of PRECISIONS (string)
+        :param directory: directory of the statevector file (string)
+        :param chunk: number of amplitude pairs processed at once (integer)
+        """
+
+        self._qubits = qubits
+        self._precision = precision
+        self._chunk = chunk
+
+        self._file = tempfile.TemporaryFile(dir=directory)
+        self._state = numpy.memmap(self._file, dtype=PRECISIONS[precision], mode="w+", shape=(1 << qubits,))
+        self._state[0] = 1
+
+        self._random = numpy.random.default_rng()
+
+    def get_precision(self):
+        """
+        Returns the floating point precision of the amplitudes
+
+        :return: (string)
+        """
+
+        return self._precision
+
+    def get_size(self):
+        """
+        Returns the size of the statevector file in bytes
+
+        :return: (integer)
+        """
+
+        return self._state.nbytes
+
+    def flush(self):
+        """
+        Writes the amplitudes changed in memory back to the statevector file
+
+        :return: (None)
+        """
+
+        self._state.flush()
+
+    def get_state(self):
+        """
+        Returns the statevector, mapped from its file, e.g. to checkpoint it
+
+        :return: (numpy.memmap)
+        """
+
+        return self._state
+
+    def set_state(self, state):
+        """
+        Replaces the statevector with :param state a chunk at a time, e.g. to resume from a memory-mapped checkpoint.
+        If :param state does not have the shape of the statevector -> ValueError raised.
+
+        :param state: (numpy.ndarray)
+        :return: (None)
+        """
+
+        if state.shape != self._state.shape:
+            raise ValueError("State of shape {0} does not fit the register".format(state.shape))
+
+        for start in range(0, len(self._state), self._chunk):
+            self._state[start:start + self._chunk] = state[start:start + self._chunk]
+
+    def reset(self):
+        """
+        Resets the register to the basis state |0...0> a chunk at a time, e.g. between two shots, keeping its file
+
+        :return: (None)
+        """
+
+        for start in range(0, len(self._state), self._chunk):
+            self._state[start:start + self._chunk] = 0
+
+        self._state[0] = 1
+
+    def get_drift(self):
+        """
+        Returns how far the squared norm of the statevector has drifted from 1 through rounding errors
+
+        :return: (float)
+        """
+
+        return abs(sum(probabilities.sum(dtype=numpy.float64) for _, probabilities in self._probabilities()) - 1)
+
+    def _halves(self, qubit):
+        """
+        Yields views of the amplitudes where :param qubit is 0 and where it is 1, a chunk at a time in file order.
+        The statevector is viewed as a (2^(qubit - 1), 2, 2^(n - qubit)) array. A stride of at least a chunk is split
+        into runs of a chunk; shorter strides are grouped, so that a chunk always covers a contiguous range.
+
+        :param qubit: qubit index, 1 <= qubit <= n (integer)
+        :return: (generator)
+        """
+
+        stride = 1 << (self._qubits - qubit)
+        view = self._state.reshape((1 << (qubit - 1), 2, stride))
+
+        if stride >= self._chunk:
+            for block in range(len(view)):
+                for start in range(0, stride, self._chunk):
+                    yield view[block, 0, start:start + self._chunk], view[block, 1, start:start + self._chunk]
+        else:
+            blocks = self._chunk // stride
+            for start in range(0, len(view), blocks):
+                yield view[start:start + blocks, 0], view[start:start + blocks, 1]
+
+    def X(self, qubit):
+        """
+        Applies the pauli x gate to :param qubit
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        for zero, one in self._halves(qubit):
+            swap = numpy.array(zero)
+            zero[...] = one
+            one[...] = swap
+
+    def Y(self, qubit):
+        """
+        Applies the pauli y gate to :param qubit
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        for zero, one in self._halves(qubit):
+            swap = numpy.array(zero)
+            numpy.multiply(one, -1j, out=zero)
+            numpy.multiply(swap, 1j, out=one)
+
+    def Z(self, qubit):
+        """
+        Applies the pauli z gate to :param qubit
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        for _, one in self._halves(qubit):
+            numpy.negative(one, out=one)
+
+    def H(self, qubit):
+        """
+        Applies the hadamard gate to :param qubit
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        for zero, one in self._halves(qubit):
+            difference = zero - one
+            zero += one
+            zero *= SQRT_HALF
+            numpy.multiply(difference, SQRT_HALF, out=one)
+
+    def R(self, qubit, phi):
+        """
+        Applies the phase shift gate to :param qubit
+
+        :param qubit: (integer)
+        :param phi: angle of the phase shift (float)
+        :return: (None)
+        """
+
+        shift = phase(phi, self._state.dtype)
+
+        for _, one in self._halves(qubit):
+            one *= shift
+
+    def SqrtNOT(self, qubit):
+        """
+        Applies the square root of not gate to :param qubit
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        self.U(qubit, SQRT_NOT)
+
+    def U(self, qubit, matrix):
+        """
+        Applies the single qubit unitary :param matrix to :param qubit
+
+        :param qubit: (integer)
+        :param matrix: 2 x 2 unitary (numpy.ndarray)
+        :return: (None)
+        """
+
+        (a, b), (c, d) = matrix.tolist()
+
+        for zero, one in self._halves(qubit):
+            previous = numpy.array(zero)
+            zero *= a
+            zero += b * one
+            one *= d
+            one += c * previous
+
+    def _probabilities(self):
+        """
+        Yields the index of the first basis state of every chunk of the statevector and the probabilities of the
+        basis states of the chunk, in file order
+
+        :return: (generator)
+        """
+
+        for start in range(0, len(self._state), self._chunk):
+            yield start, numpy.abs(self._state[start:start + self._chunk]) ** 2
+
+    def measure(self):
+        """
+        Observes the register, collapsing it to the observed basis state
+
+        :return: (string)
+        """
+
+        index = int(self._draw(1)[0])
+
+        for start in range(0, len(self._state), self._chunk):
+            self._state[start:start + self._chunk] = 0
+
+        self._state[index] = 1
+        return self._format(index)
+
+    def sample(self, shots):
+        """
+        Observes the register :param shots times without collapsing it, in two passes over the file
+
+        :param shots: number of observations (integer)
+        :return: observations and the number of times each was made (list)
+        """
+
+        observed, counts = numpy.unique(self._draw(shots), return_counts=True)
+        return [(self._format(index), count) for index, count in zip(observed.tolist(), counts.tolist())]
+
+    def _draw(self, shots):
+        """
+        Draws :param shots basis state indices from the distribution of the register.
+        The first pass over the file sums the probabilities; the draws are then sorted, so the second pass finds the
+        draws that fall in each chunk by a binary search in that chunk's cumulative distribution alone.
+
+        :param shots: (integer)
+        :return: (numpy.ndarray)
+        """
+
+        total = sum(probabilities.sum(dtype=numpy.float64) for _, probabilities in self._probabilities())
+        draws = numpy.sort(self._random.random(shots)) * total
+
+        indices, offset, first = numpy.empty(shots, dtype=numpy.int64), 0.0, 0
+        for start, probabilities in self._probabilities():
+            cumulative = numpy.cumsum(probabilities, dtype=numpy.float64)
+            cumulative += offset
+
+            last = int(numpy.searchsorted(draws, cumulative[-1], side="left"))
+            indices[first:last] = numpy.searchsorted(cumulative, draws[first:last], side="right") + start
+
+            offset, first = cumulative[-1], last
+
+        indices[first:] = len(self._state) - 1
+        numpy.clip(indices, 0, len(self._state) - 1, out=indices)
+
+        return indices
+
+    def _format(self, index):
+        """
+        Returns the observation of the basis state :param index
+
+        :param index: (integer)
+        :return: (string)
+        """
+
+        return "|psi> = |{0}>".format(format(index, "0{0}b".format(self._qubits)))
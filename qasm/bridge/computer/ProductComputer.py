@@ -0,0 +1,169 @@
+import math
+
+import numpy
+
+from qasm.compiler.Gates import phase
+
+
+SQRT_HALF = 1 / math.sqrt(2)
+
+
+class ProductComputer:
+
+    def __init__(self, qubits):
+        """
+        ProductComputer constructor.
+        Native quantum computer backend for the single qubit gate set. No gate acts on two qubits, so the register is
+        never entangled and its state is exactly the product of n independent qubit states. Each qubit is stored as
+        the two amplitudes (a, b) of a|0> + b|1>, so a gate costs O(1) whatever the size of the register and a
+        measurement samples each qubit independently in O(n).
+        Qubit 1 is the leftmost bit of a measurement.
+
+        :param qubits: number of qubits in the register (integer)
+        """
+
+        self._qubits = qubits
+
+        self._zero = [1 + 0j] * qubits
+        self._one = [0j] * qubits
+
+        self._random = numpy.random.default_rng()
+
+    def X(self, qubit):
+        """
+        Applies the pauli x gate to :param qubit
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        index = qubit - 1
+        self._zero[index], self._one[index] = self._one[index], self._zero[index]
+
+    def Y(self, qubit):
+        """
+        Applies the pauli y gate to :param qubit
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        index = qubit - 1
+        self._zero[index], self._one[index] = -1j * self._one[index], 1j * self._zero[index]
+
+    def Z(self, qubit):
+        """
+        Applies the pauli z gate to :param qubit
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        self._one[qubit - 1] = -self._one[qubit - 1]
+
+    def H(self, qubit):
+        """
+        Applies the hadamard gate to :param qubit
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        index = qubit - 1
+        a, b = self._zero[index], self._one[index]
+
+        self._zero[index], self._one[index] = (a + b) * SQRT_HALF, (a - b) * SQRT_HALF
+
+    def R(self, qubit, phi):
+        """
+        Applies the phase shift gate to :param qubit
+
+        :param qubit: (integer)
+        :param phi: angle of the phase shift (float)
+        :return: (None)
+        """
+
+        self._one[qubit - 1] *= phase(phi)
+
+    def SqrtNOT(self, qubit):
+        """
+        Applies the square root of not gate to :param qubit
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        index = qubit - 1
+        a, b = self._zero[index], self._one[index]
+
+        self._zero[index] = (0.5 + 0.5j) * a + (0.5 - 0.5j) * b
+        self._one[index] = (0.5 - 0.5j) * a + (0.5 + 0.5j) * b
+
+    def U(self, qubit, matrix):
+        """
+        Applies the single qubit unitary :param matrix to :param qubit
+
+        :param qubit: (integer)
+        :param matrix: 2 x 2 unitary (numpy.ndarray)
+        :return: (None)
+        """
+
+        index = qubit - 1
+        a, b = self._zero[index], self._one[index]
+        (m00, m01), (m10, m11) = matrix.tolist()
+
+        self._zero[index], self._one[index] = m00 * a + m01 * b, m10 * a + m11 * b
+
+    def get_probabilities(self):
+        """
+        Returns the probability of observing each qubit as 1
+
+        :return: (numpy.ndarray)
+        """
+
+        zero = numpy.abs(numpy.array(self._zero)) ** 2
+        one = numpy.abs(numpy.array(self._one)) ** 2
+
+        return one / (zero + one)
+
+    def measure(self):
+        """
+        Observes the register, collapsing every qubit to its observed state
+
+        :return: (string)
+        """
+
+        bits = (self._random.random(self._qubits) < self.get_probabilities()).tolist()
+
+        self._zero = [0j if bit else 1 + 0j for bit in bits]
+        self._one = [1 + 0j if bit else 0j for bit in bits]
+
+        return self._format(bits)
+
+    def sample(self, shots):
+        """
+        Observes the register :param shots times in one vectorized pass, without collapsing it.
+        Every qubit of every shot is drawn independently; identical observations are then counted once the bits
+        of each shot have been packed into bytes.
+
+        :param shots: number of observations (integer)
+        :return: observations and the number of times each was made (list)
+        """
+
+        bits = self._random.random((shots, self._qubits)) < self.get_probabilities()
+        observed, counts = numpy.unique(numpy.packbits(bits, axis=1), axis=0, return_counts=True)
+
+        return [
+            (self._format(numpy.unpackbits(row)[:self._qubits].tolist()), count)
+            for row, count in zip(observed, counts.tolist())
+        ]
+
+    def _format(self, bits):
+        """
+        Returns the observation of the qubit values :param bits
+
+        :param bits: value of each qubit, qubit 1 first (list)
+        :return: (string)
+        """
+
+        return "|psi> = |{0}>".format("".join("1" if bit else "0" for bit in bits))
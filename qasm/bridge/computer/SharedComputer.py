@@ -0,0 +1,415 @@
+from multiprocessing.shared_memory import SharedMemory
+import multiprocessing
+import weakref
+import os
+
+import numpy
+
+from qasm.helpers.Constants import PRECISIONS, SHARED_PARTITION_SIZE, ALIAS_RATIO
+from qasm.bridge.computer.AliasTable import AliasTable
+from qasm.compiler.Gates import phase
+from qasm.bridge.computer.Kernels import SQRT_NOT, pauli_x, pauli_y, pauli_z, hadamard, phase_shift, unitary
+
+
+COMMAND_BLOCK = 1 << 10
+
+KERNELS = {
+    "X": pauli_x,
+    "Y": pauli_y,
+    "Z": pauli_z,
+    "H": hadamard,
+    "R": phase_shift,
+    "U": unitary
+}
+
+
+def work(memory, qubits, dtype, partitions, index, commands, barrier, done):
+    """
+    Worker process of SharedComputer. Applies every command of every block received on :param commands to
+    partition :param index of the statevector stored in :param memory, until None is received.
+    A gate on a qubit whose amplitude pairs lie in different partitions is applied to half of the pairs of this
+    partition and its partner, between two waits on :param barrier so that neither partition is used by another
+    gate meanwhile. An error breaks the barrier, so that the other workers stop too, and is sent on :param done;
+    the worker then answers every later sync with it.
+
+    :param memory: (multiprocessing.shared_memory.SharedMemory)
+    :param qubits: number of qubits in the register (integer)
+    :param dtype: (string)
+    :param partitions: number of partitions, a power of 2 (integer)
+    :param index: (integer)
+    :param commands: (multiprocessing.SimpleQueue)
+    :param barrier: (multiprocessing.Barrier)
+    :param done: (multiprocessing.SimpleQueue)
+    :return: (None)
+    """
+
+    state = numpy.ndarray(1 << qubits, dtype=dtype, buffer=memory.buf)
+
+    size = len(state) // partitions
+    bits = partitions.bit_length() - 1
+    start = index * size
+    own = state[start:start + size]
+
+    try:
+        for block in iter(commands.get, None):
+            for command, qubit, arguments in block:
+                if command == "sync":
+                    done.put(None)
+                elif command == "collapse":
+                    own[...] = 0
+                    if start <= qubit < start + size:
+                        own[qubit - start] = 1
+                elif qubit > bits:
+                    view = own.reshape((1 << (qubit - 1 - bits), 2, 1 << (qubits - qubit)))
+                    KERNELS[command](view[:, 0], view[:, 1], *arguments)
+                else:
+                    bit = 1 << (bits - qubit)
+                    partner = (index ^ bit) * size
+                    half = size // 2
+
+                    if index & bit:
+                        zero, one = state[partner + half:partner + size], own[half:]
+                    else:
+                        zero, one = own[:half], state[partner:partner + half]
+
+                    barrier.wait()
+                    KERNELS[command](zero, one, *arguments)
+                    barrier.wait()
+    except Exception as error:
+        barrier.abort()
+        done.put(error)
+
+        for block in iter(commands.get, None):
+            for command, _, _ in block:
+                if command == "sync":
+                    done.put(error)
+
+
+def shutdown(memory, processes, commands):
+    """
+    Stops the worker processes and releases the shared statevector
+
+    :param memory: (multiprocessing.shared_memory.SharedMemory)
+    :param processes: (list)
+    :param commands: (list)
+    :return: (None)
+    """
+
+    for queue in commands:
+        queue.put(None)
+
+    for process in processes:
+        process.join()
+
+    try:
+        memory.close()
+    except BufferError:
+        pass
+
+    memory.unlink()
+
+
+class SharedComputer:
+
+    def __init__(self, qubits, precision="double", processes=None):
+        """
+        SharedComputer constructor.
+        Native quantum computer backend splitting the dense statevector into contiguous partitions held in
+        multiprocessing.shared_memory, one per worker process, so a single execution runs on every core and memory
+        node of the machine.
+        Gates on the qubits whose amplitude pairs lie within a partition (every qubit but the first log2(partitions))
+        are applied by each worker to its own partition, without any coordination. A gate on one of the first qubits
+        pairs every partition with a partner; the two workers each update half of the pairs, between two barriers.
+        Gates are queued to the workers in blocks and only waited for when the register is observed.
+        Qubit 1 is the most significant bit of a basis state index (and the leftmost bit of a measurement).
+
+        :param qubits: number of qubits in the register (integer)
+        :param precision: floating point precision of the amplitudes, a key of PRECISIONS (string)
+        :param processes: largest number of worker processes, rounded down to a power of 2 so that every partition
+                          holds at least SHARED_PARTITION_SIZE amplitudes (default: number of cores) (integer)
+        """
+
+        self._qubits = qubits
+        self._precision = precision
+
+        dtype = numpy.dtype(PRECISIONS[precision])
+
+        partitions = 1 << ((processes or os.cpu_count()).bit_length() - 1)
+        while partitions > 1 and (1 << qubits) // partitions < SHARED_PARTITION_SIZE:
+            partitions //= 2
+
+        self._memory = SharedMemory(create=True, size=(1 << qubits) * dtype.itemsize)
+        self._state = numpy.ndarray(1 << qubits, dtype=dtype, buffer=self._memory.buf)
+        self._state[...] = 0
+        self._state[0] = 1
+
+        barrier = multiprocessing.Barrier(partitions)
+        self._done = multiprocessing.SimpleQueue()
+        self._commands = [multiprocessing.SimpleQueue() for _ in range(partitions)]
+        self._processes = [
+            multiprocessing.Process(target=work, args=(
+                self._memory, qubits, dtype.str, partitions, index, commands, barrier, self._done
+            ), daemon=True)
+            for index, commands in enumerate(self._commands)
+        ]
+
+        for process in self._processes:
+            process.start()
+
+        self._pending = []
+        self._failure = None
+        self._table = None
+        self._finalizer = weakref.finalize(self, shutdown, self._memory, self._processes, self._commands)
+
+        self._random = numpy.random.default_rng()
+
+    def get_precision(self):
+        """
+        Returns the floating point precision of the amplitudes
+
+        :return: (string)
+        """
+
+        return self._precision
+
+    def get_partitions(self):
+        """
+        Returns the number of partitions of the statevector, one per worker process
+
+        :return: (integer)
+        """
+
+        return len(self._processes)
+
+    def _queue(self, command, qubit, *arguments):
+        """
+        Queues :param command for every worker, sending the queued commands once a block is full.
+        Every command but a sync changes the register, so the alias table of the register is dropped.
+
+        :param command: a key of KERNELS, "collapse" or "sync" (string)
+        :param qubit: (integer)
+        :param arguments: (tuple)
+        :return: (None)
+        """
+
+        self._pending.append((command, qubit, arguments))
+        if command != "sync":
+            self._table = None
+
+        if len(self._pending) >= COMMAND_BLOCK:
+            self._send()
+
+    def _send(self):
+        """
+        Sends the queued commands to every worker
+
+        :return: (None)
+        """
+
+        for commands in self._commands:
+            commands.put(self._pending)
+
+        self._pending = []
+
+    def _sync(self):
+        """
+        Waits for every worker to apply every queued command.
+        If a worker failed -> its error raised, now and on every later call, as the workers have stopped.
+
+        :return: (None)
+        """
+
+        if self._failure is None:
+            self._queue("sync", 0)
+            self._send()
+
+            errors = [self._done.get() for _ in self._processes]
+            self._failure = next((error for error in errors if error is not None), None)
+
+        if self._failure is not None:
+            raise self._failure
+
+    def X(self, qubit):
+        """
+        Applies the pauli x gate to :param qubit
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        self._queue("X", qubit)
+
+    def Y(self, qubit):
+        """
+        Applies the pauli y gate to :param qubit
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        self._queue("Y", qubit)
+
+    def Z(self, qubit):
+        """
+        Applies the pauli z gate to :param qubit
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        self._queue("Z", qubit)
+
+    def H(self, qubit):
+        """
+        Applies the hadamard gate to :param qubit
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        self._queue("H", qubit)
+
+    def R(self, qubit, phi):
+        """
+        Applies the phase shift gate to :param qubit
+
+        :param qubit: (integer)
+        :param phi: angle of the phase shift (float)
+        :return: (None)
+        """
+
+        self._queue("R", qubit, phase(phi, self._state.dtype))
+
+    def SqrtNOT(self, qubit):
+        """
+        Applies the square root of not gate to :param qubit
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        self.U(qubit, SQRT_NOT)
+
+    def U(self, qubit, matrix):
+        """
+        Applies the single qubit unitary :param matrix to :param qubit
+
+        :param qubit: (integer)
+        :param matrix: 2 x 2 unitary (numpy.ndarray)
+        :return: (None)
+        """
+
+        self._queue("U", qubit, *(entry for row in matrix.tolist() for entry in row))
+
+    def get_state(self):
+        """
+        Returns the statevector once every queued gate is applied, e.g. to checkpoint it
+
+        :return: (numpy.ndarray)
+        """
+
+        self._sync()
+        return self._state
+
+    def set_state(self, state):
+        """
+        Replaces the statevector with :param state once every queued gate is applied, e.g. to resume from a
+        checkpoint.
+        If :param state does not have the shape of the statevector -> ValueError raised.
+
+        :param state: (numpy.ndarray)
+        :return: (None)
+        """
+
+        if state.shape != self._state.shape:
+            raise ValueError("State of shape {0} does not fit the register".format(state.shape))
+
+        self._sync()
+
+        self._table = None
+        self._state[...] = state
+
+    def reset(self):
+        """
+        Resets the register to the basis state |0...0>, e.g. between two shots, keeping its shared memory and worker
+        processes. Every worker clears its own partition.
+
+        :return: (None)
+        """
+
+        self._queue("collapse", 0)
+
+    def get_drift(self):
+        """
+        Returns how far the squared norm of the statevector has drifted from 1 through rounding errors
+
+        :return: (float)
+        """
+
+        self._sync()
+        return abs(float((numpy.abs(self._state) ** 2).sum(dtype=numpy.float64)) - 1)
+
+    def get_probabilities(self):
+        """
+        Returns the probability of observing each basis state
+
+        :return: (numpy.ndarray)
+        """
+
+        self._sync()
+
+        probabilities = numpy.abs(self._state) ** 2
+        return probabilities / probabilities.sum(dtype=numpy.float64)
+
+    def measure(self):
+        """
+        Observes the register, collapsing it to the observed basis state. Every worker clears its own partition.
+
+        :return: (string)
+        """
+
+        index = int(self._draw(1)[0])
+        self._queue("collapse", index)
+
+        return self._format(index)
+
+    def sample(self, shots):
+        """
+        Observes the register :param shots times in one vectorized pass, without collapsing it.
+
+        :param shots: number of observations (integer)
+        :return: observations and the number of times each was made (list)
+        """
+
+        observed, counts = numpy.unique(self._draw(shots), return_counts=True)
+        return [(self._format(index), count) for index, count in zip(observed.tolist(), counts.tolist())]
+
+    def _draw(self, shots):
+        """
+        Draws :param shots basis state indices from the distribution of the register, from its alias table for many
+        shots (see qasm.bridge.computer.StatevectorComputer.StatevectorComputer._draw)
+
+        :param shots: (integer)
+        :return: (numpy.ndarray)
+        """
+
+        if self._table is None and shots * ALIAS_RATIO >= len(self._state):
+            self._table = AliasTable(self.get_probabilities())
+
+        if self._table is not None:
+            return self._table.draw(shots, self._random)
+
+        cumulative = numpy.cumsum(self.get_probabilities(), dtype=numpy.float64)
+        indices = numpy.searchsorted(cumulative, self._random.random(shots) * cumulative[-1], side="right")
+
+        return numpy.minimum(indices, len(cumulative) - 1)
+
+    def _format(self, index):
+        """
+        Returns the observation of the basis state :param index
+
+        :param index: (integer)
+        :return: (string)
+        """
+
+        return "|psi> = |{0}>".format(format(index, "0{0}b".format(self._qubits)))
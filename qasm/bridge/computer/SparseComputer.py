@@ -0,0 +1,237 @@
+import numpy
+
+from qasm.helpers.Constants import SPARSE_TOLERANCE
+from qasm.compiler.Gates import phase
+
+
+SQRT_HALF = 1 / numpy.sqrt(2)
+
+HADAMARD = numpy.array([
+    [SQRT_HALF, SQRT_HALF],
+    [SQRT_HALF, -SQRT_HALF]
+])
+
+SQRT_NOT = numpy.array([
+    [0.5 + 0.5j, 0.5 - 0.5j],
+    [0.5 - 0.5j, 0.5 + 0.5j]
+])
+
+
+class SparseComputer:
+
+    def __init__(self, qubits, tolerance=SPARSE_TOLERANCE):
+        """
+        SparseComputer constructor.
+        Native quantum computer backend holding only the basis states with a non-zero amplitude, as a sorted array of
+        basis state indices and an array of their amplitudes. Memory and time grow with the number of such states
+        rather than with 2^n, so registers far beyond the reach of the dense statevector can be simulated as long as
+        few states are in superposition. Amplitudes whose magnitude falls below :param tolerance are pruned.
+        Qubit 1 is the most significant bit of a basis state index (and the leftmost bit of a measurement).
+
+        :param qubits: number of qubits in the register (integer)
+        :param tolerance: magnitude below which an amplitude is treated as zero (float)
+        """
+
+        self._qubits = qubits
+        self._tolerance = tolerance
+
+        self._dtype = numpy.int64 if qubits < 63 else object
+
+        self._indices = numpy.zeros(1, dtype=self._dtype)
+        self._amplitudes = numpy.ones(1, dtype=numpy.complex128)
+
+        self._random = numpy.random.default_rng()
+
+    def _mask(self, qubit):
+        """
+        Returns the bit of a basis state index that holds :param qubit
+
+        :param qubit: qubit index, 1 <= qubit <= n (integer)
+        :return: (integer)
+        """
+
+        return self._dtype(1 << (self._qubits - qubit)) if self._dtype is not object else 1 << (self._qubits - qubit)
+
+    def _ones(self, qubit):
+        """
+        Returns whether :param qubit is 1 in each stored basis state
+
+        :param qubit: (integer)
+        :return: (numpy.ndarray)
+        """
+
+        return (self._indices & self._mask(qubit)) != 0
+
+    def _flip(self, qubit):
+        """
+        Flips :param qubit in every stored basis state, keeping the basis states sorted
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        indices = self._indices ^ self._mask(qubit)
+        order = numpy.argsort(indices, kind="stable")
+
+        self._indices = indices[order]
+        self._amplitudes = self._amplitudes[order]
+
+    def X(self, qubit):
+        """
+        Applies the pauli x gate to :param qubit
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        self._flip(qubit)
+
+    def Y(self, qubit):
+        """
+        Applies the pauli y gate to :param qubit
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        self._amplitudes *= numpy.where(self._ones(qubit), -1j, 1j)
+        self._flip(qubit)
+
+    def Z(self, qubit):
+        """
+        Applies the pauli z gate to :param qubit
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        ones = self._ones(qubit)
+        self._amplitudes[ones] *= -1
+
+    def H(self, qubit):
+        """
+        Applies the hadamard gate to :param qubit
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        self.U(qubit, HADAMARD)
+
+    def R(self, qubit, phi):
+        """
+        Applies the phase shift gate to :param qubit
+
+        :param qubit: (integer)
+        :param phi: angle of the phase shift (float)
+        :return: (None)
+        """
+
+        ones = self._ones(qubit)
+        self._amplitudes[ones] *= phase(phi)
+
+    def SqrtNOT(self, qubit):
+        """
+        Applies the square root of not gate to :param qubit
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        self.U(qubit, SQRT_NOT)
+
+    def U(self, qubit, matrix):
+        """
+        Applies the single qubit unitary :param matrix to :param qubit.
+        Every stored basis state sends an amplitude to itself and to its partner with :param qubit flipped; the
+        amplitudes sent to the same basis state are summed and the ones that cancel out are pruned.
+
+        :param qubit: (integer)
+        :param matrix: 2 x 2 unitary (numpy.ndarray)
+        :return: (None)
+        """
+
+        mask = self._mask(qubit)
+        ones = self._ones(qubit).astype(numpy.intp)
+        matrix = numpy.asarray(matrix)
+
+        zero = self._indices & ~mask
+        indices = numpy.concatenate([zero, zero | mask])
+        amplitudes = numpy.concatenate([matrix[0, ones], matrix[1, ones]]) * numpy.tile(self._amplitudes, 2)
+
+        self._indices, inverse = numpy.unique(indices, return_inverse=True)
+        self._amplitudes = (
+            numpy.bincount(inverse, amplitudes.real, len(self._indices))
+            + 1j * numpy.bincount(inverse, amplitudes.imag, len(self._indices))
+        )
+
+        self._prune()
+
+    def _prune(self):
+        """
+        Removes the basis states whose amplitude is below the tolerance
+
+        :return: (None)
+        """
+
+        keep = numpy.abs(self._amplitudes) >= self._tolerance
+        if not keep.all():
+            self._indices = self._indices[keep]
+            self._amplitudes = self._amplitudes[keep]
+
+    def get_states(self):
+        """
+        Returns the number of stored basis states
+
+        :return: (integer)
+        """
+
+        return len(self._indices)
+
+    def measure(self):
+        """
+        Observes the register, collapsing it to the observed basis state
+
+        :return: (string)
+        """
+
+        index = self._indices[self._draw(1)[0]]
+
+        self._indices = numpy.array([index], dtype=self._dtype)
+        self._amplitudes = numpy.ones(1, dtype=numpy.complex128)
+
+        return self._format(index)
+
+    def sample(self, shots):
+        """
+        Observes the register :param shots times in one vectorized pass, without collapsing it.
+
+        :param shots: number of observations (integer)
+        :return: observations and the number of times each was made (list)
+        """
+
+        positions, counts = numpy.unique(self._draw(shots), return_counts=True)
+        return [(self._format(self._indices[position]), count) for position, count in zip(positions, counts.tolist())]
+
+    def _draw(self, shots):
+        """
+        Draws :param shots positions in the stored basis states from the distribution of the register
+
+        :param shots: (integer)
+        :return: (numpy.ndarray)
+        """
+
+        cumulative = numpy.cumsum(numpy.abs(self._amplitudes) ** 2)
+        positions = numpy.searchsorted(cumulative, self._random.random(shots) * cumulative[-1], side="right")
+
+        return numpy.minimum(positions, len(cumulative) - 1)
+
+    def _format(self, index):
+        """
+        Returns the observation of the basis state :param index
+
+        :param index: (integer)
+        :return: (string)
+        """
+
+        return "|psi> = |{0}>".format(format(int(index), "0{0}b".format(self._qubits)))
@@ -0,0 +1,373 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy
+
+from qasm.helpers.Constants import PRECISIONS, THREAD_THRESHOLD, ALIAS_RATIO
+from qasm.bridge.computer.AliasTable import AliasTable
+from qasm.compiler.Gates import phase
+from qasm.bridge.computer.Kernels import SQRT_NOT, pauli_x, pauli_y, pauli_z, hadamard, phase_shift, unitary
+
+
+POOLS = {}
+
+
+def thread_pool(threads):
+    """
+    Returns the thread pool of :param threads workers, shared by every register (e.g. the register of each shot)
+
+    :param threads: (integer)
+    :return: (concurrent.futures.ThreadPoolExecutor)
+    """
+
+    if threads not in POOLS:
+        POOLS[threads] = ThreadPoolExecutor(threads)
+
+    return POOLS[threads]
+
+
+class StatevectorComputer:
+
+    def __init__(self, qubits, batch=None, precision="double", threads=1):
+        """
+        StatevectorComputer constructor.
+        Native quantum computer backend holding the register as a dense complex statevector. Gates are applied in
+        place to strided views of the statevector; no 2^n x 2^n matrix is ever built.
+        Qubit 1 is the most significant bit of a basis state index (and the leftmost bit of a measurement).
+
+        With :param batch the backend simulates that many registers at once (e.g. one per binding of a parameter
+        sweep) as a leading axis of the statevector. Every gate is applied to all of them in one NumPy operation and
+        phase shift angles may be given per register.
+
+        With :param precision "single" the amplitudes are stored as complex64 instead of complex128, halving the
+        memory of the statevector and the bandwidth of every gate. Rounding errors then accumulate faster; they can be
+        monitored with get_drift.
+
+        With :param threads > 1 the amplitude pairs of every gate are split across a pool of that many threads, once
+        the statevector holds at least THREAD_THRESHOLD amplitudes; smaller statevectors are updated serially, as
+        starting the threads would cost more than the gate.
+
+        :param qubits: number of qubits in the register (integer)
+        :param batch: number of registers simulated side by side (integer)
+        :param precision: floating point precision of the amplitudes, a key of PRECISIONS (string)
+        :param threads: number of threads applying each gate (integer)
+        """
+
+        self._qubits = qubits
+        self._batch = batch
+        self._precision = precision
+        self._threads = threads
+
+        self._state = numpy.zeros(
+            (1 << qubits,) if batch is None else (batch, 1 << qubits), dtype=PRECISIONS[precision]
+        )
+        self._state[..., 0] = 1
+
+        self._pool = thread_pool(threads) if threads > 1 and self._state.size >= THREAD_THRESHOLD else None
+        self._tables = None
+
+        self._random = numpy.random.default_rng()
+
+    def get_batch(self):
+        """
+        Returns the number of registers simulated side by side, or None for a single register
+
+        :return: (integer)
+        """
+
+        return self._batch
+
+    def get_precision(self):
+        """
+        Returns the floating point precision of the amplitudes
+
+        :return: (string)
+        """
+
+        return self._precision
+
+    def get_threads(self):
+        """
+        Returns the number of threads applying each gate
+
+        :return: (integer)
+        """
+
+        return self._threads
+
+    def get_state(self):
+        """
+        Returns the statevector (of every register of a batch), e.g. to checkpoint it
+
+        :return: (numpy.ndarray)
+        """
+
+        return self._state
+
+    def set_state(self, state):
+        """
+        Replaces the statevector with :param state, e.g. to resume from a checkpoint.
+        If :param state does not have the shape of the statevector -> ValueError raised.
+
+        :param state: (numpy.ndarray)
+        :return: (None)
+        """
+
+        if state.shape != self._state.shape:
+            raise ValueError("State of shape {0} does not fit the register".format(state.shape))
+
+        self._tables = None
+        self._state[...] = state
+
+    def get_drift(self):
+        """
+        Returns how far the squared norm of the statevector has drifted from 1 through rounding errors, the largest
+        drift of any register of a batch. The norm is summed in double precision whatever the precision of the
+        amplitudes.
+
+        :return: (float)
+        """
+
+        norm = (numpy.abs(self._state) ** 2).sum(axis=-1, dtype=numpy.float64)
+        return float(numpy.max(numpy.abs(norm - 1)))
+
+    def _halves(self, qubit):
+        """
+        Returns views of the amplitudes where :param qubit is 0 and where it is 1. The statevector is viewed as a
+        (2^(qubit - 1), 2, 2^(n - qubit)) array, so the two views pair every amplitude with its partner.
+
+        :param qubit: qubit index, 1 <= qubit <= n (integer)
+        :return: (tuple)
+        """
+
+        view = self._state.reshape(self._state.shape[:-1] + (1 << (qubit - 1), 2, 1 << (self._qubits - qubit)))
+        return view[..., 0, :], view[..., 1, :]
+
+    def _parts(self, qubit):
+        """
+        Splits the amplitude pairs of :param qubit into one disjoint part per thread, as (zero, one) view pairs.
+        The pairs are split along the blocks of the qubit if there are enough of them, otherwise within each block.
+
+        :param qubit: qubit index, 1 <= qubit <= n (integer)
+        :return: (list)
+        """
+
+        zero, one = self._halves(qubit)
+        if self._pool is None:
+            return [(zero, one)]
+
+        blocks, stride = zero.shape[-2:]
+        if blocks >= self._threads:
+            bounds = numpy.linspace(0, blocks, self._threads + 1).astype(int).tolist()
+            return [(zero[..., a:b, :], one[..., a:b, :]) for a, b in zip(bounds, bounds[1:])]
+
+        bounds = numpy.linspace(0, stride, self._threads + 1).astype(int).tolist()
+        return [(zero[..., a:b], one[..., a:b]) for a, b in zip(bounds, bounds[1:])]
+
+    def _apply(self, qubit, kernel, *arguments):
+        """
+        Applies :param kernel to the amplitude pairs of :param qubit, across the thread pool for a large statevector.
+        NumPy releases the GIL while it works on an array, so the parts are processed in parallel.
+
+        :param qubit: qubit index, 1 <= qubit <= n (integer)
+        :param kernel: function of the zero and one views and :param arguments, updating them in place (function)
+        :param arguments: (tuple)
+        :return: (None)
+        """
+
+        self._tables = None
+
+        parts = self._parts(qubit)
+        if len(parts) == 1:
+            kernel(*parts[0], *arguments)
+            return
+
+        for future in [self._pool.submit(kernel, zero, one, *arguments) for zero, one in parts]:
+            future.result()
+
+    def X(self, qubit):
+        """
+        Applies the pauli x gate to :param qubit
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        self._apply(qubit, pauli_x)
+
+    def Y(self, qubit):
+        """
+        Applies the pauli y gate to :param qubit
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        self._apply(qubit, pauli_y)
+
+    def Z(self, qubit):
+        """
+        Applies the pauli z gate to :param qubit
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        self._apply(qubit, pauli_z)
+
+    def H(self, qubit):
+        """
+        Applies the hadamard gate to :param qubit
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        self._apply(qubit, hadamard)
+
+    def R(self, qubit, phi):
+        """
+        Applies the phase shift gate to :param qubit
+
+        :param qubit: (integer)
+        :param phi: angle of the phase shift, or one angle per register of the batch (float | numpy.ndarray)
+        :return: (None)
+        """
+
+        if numpy.ndim(phi):
+            shift = numpy.exp(1j * numpy.reshape(phi, numpy.shape(phi) + (1, 1))).astype(self._state.dtype)
+        else:
+            shift = phase(phi, self._state.dtype)
+
+        self._apply(qubit, phase_shift, shift)
+
+    def SqrtNOT(self, qubit):
+        """
+        Applies the square root of not gate to :param qubit
+
+        :param qubit: (integer)
+        :return: (None)
+        """
+
+        self.U(qubit, SQRT_NOT)
+
+    def U(self, qubit, matrix):
+        """
+        Applies the single qubit unitary :param matrix to :param qubit
+
+        :param qubit: (integer)
+        :param matrix: 2 x 2 unitary (numpy.ndarray)
+        :return: (None)
+        """
+
+        self._apply(qubit, unitary, *(entry for row in matrix.tolist() for entry in row))
+
+    def get_probabilities(self):
+        """
+        Returns the probability of observing each basis state
+
+        :return: (numpy.ndarray)
+        """
+
+        probabilities = numpy.abs(self._state) ** 2
+        return probabilities / probabilities.sum(axis=-1, keepdims=True, dtype=numpy.float64)
+
+    def measure(self):
+        """
+        Observes the register, collapsing it to the observed basis state.
+        A batch of registers returns one observation per register.
+
+        :return: (string | list)
+        """
+
+        indices = self._draw(1)[..., 0]
+
+        self._tables = None
+        self._state[...] = 0
+        if self._batch is None:
+            self._state[indices] = 1
+            return self._format(int(indices))
+
+        self._state[numpy.arange(self._batch), indices] = 1
+        return [self._format(index) for index in indices.tolist()]
+
+    def sample(self, shots):
+        """
+        Observes the register :param shots times in one vectorized pass, without collapsing it.
+        A batch of registers returns the observations of each register.
+
+        :param shots: number of observations (integer)
+        :return: observations and the number of times each was made (list)
+        """
+
+        indices = self._draw(shots)
+
+        if self._batch is None:
+            return self._count(indices)
+
+        return [self._count(row) for row in indices]
+
+    def _draw(self, shots):
+        """
+        Draws :param shots basis state indices from the distribution of every register.
+        Many shots are drawn in O(1) each from an alias table of every register, built once per state of the register
+        (see qasm.bridge.computer.AliasTable.AliasTable). A few shots do not repay building the table and are found by
+        one binary search instead.
+
+        :param shots: (integer)
+        :return: indices, with a leading batch axis for a batch of registers (numpy.ndarray)
+        """
+
+        if self._tables is None and shots * ALIAS_RATIO >= 1 << self._qubits:
+            self._tables = [AliasTable(row) for row in self.get_probabilities().reshape(-1, 1 << self._qubits)]
+
+        if self._tables is not None:
+            indices = numpy.stack([table.draw(shots, self._random) for table in self._tables])
+        else:
+            indices = self._search(shots)
+
+        return indices if self._batch is not None else indices[0]
+
+    def _search(self, shots):
+        """
+        Draws :param shots basis state indices from the distribution of every register in one binary search.
+        The cumulative distribution of register k is shifted to [k, k + 1], so the distributions of a whole batch
+        form one sorted array.
+
+        :param shots: (integer)
+        :return: indices, with a leading batch axis (numpy.ndarray)
+        """
+
+        size = 1 << self._qubits
+        cumulative = numpy.cumsum(self.get_probabilities().reshape(-1, size), axis=1, dtype=numpy.float64)
+        cumulative /= cumulative[:, -1:]
+
+        rows = numpy.arange(len(cumulative))[:, numpy.newaxis]
+        cumulative += rows
+
+        indices = numpy.searchsorted(
+            cumulative.ravel(), self._random.random((len(cumulative), shots)) + rows, side="right"
+        ) - rows * size
+        numpy.clip(indices, 0, size - 1, out=indices)
+
+        return indices
+
+    def _count(self, indices):
+        """
+        Returns each observed basis state of :param indices with the number of times it was observed
+
+        :param indices: (numpy.ndarray)
+        :return: (list)
+        """
+
+        observed, counts = numpy.unique(indices, return_counts=True)
+        return [(self._format(index), count) for index, count in zip(observed.tolist(), counts.tolist())]
+
+    def _format(self, index):
+        """
+        Returns the observation of the basis state :param index
+
+        :param index: (integer)
+        :return: (string)
+        """
+
+        return "|psi> = |{0}>".format(format(index, "0{0}b".format(self._qubits)))
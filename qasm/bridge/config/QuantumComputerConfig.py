@@ -20,3 +20,10 @@ class QuantumComputerConfig:
     def get_qubits():
         return QuantumComputerConfig.get_config()["qubits"]
 
+    @staticmethod
+    def get_backend():
+        return QuantumComputerConfig.get_config().get("backend", "external")
+
+    @staticmethod
+    def get_precision():
+        return QuantumComputerConfig.get_config().get("precision", "double")
@@ -0,0 +1,190 @@
+import re as regular_expression
+import struct
+import sys
+
+import numpy
+
+from qasm.helpers.Constants import OBSERVATION_REGEX, SINK_BUFFER_SIZE, NPY_HEADER_SIZE
+
+
+class BinarySink:
+
+    def __init__(self, file_location=None, header=False, append=False):
+        """
+        BinarySink constructor.
+        Result sink writing the measurements as a bit-packed binary stream: every measurement takes ceil(n / 8) bytes
+        holding the bits of the register, qubit 1 first (as numpy.packbits). The measurements of a batch of registers
+        are written register after register, so the stream is an array of shape (measurements, ceil(n / 8)), or
+        (measurements, registers, ceil(n / 8)) for a parameter sweep.
+        Histogram entries are written as records of the register (uint32), the measurements of a run (uint8, shape
+        (measurements, ceil(n / 8))) and their count (uint64).
+
+        With :param header the stream is a NumPy .npy file, which numpy.load can memory-map; its header is completed
+        once the number of results is known, so it needs a file.
+
+        :param file_location: path of the file the results are written to (default: standard output) (string)
+        :param header: whether to write a .npy header (boolean)
+        :param append: whether to append to the file instead of replacing it, e.g. when resuming; not supported with
+                       :param header (boolean)
+        """
+
+        self._file = sys.stdout.buffer if file_location is None else open(file_location, "ab" if append else "wb")
+        self._owned = file_location is not None
+        self._header = header
+
+        self._width = 0
+        self._registers = ()
+        self._dtype = numpy.dtype(numpy.uint8)
+        self._shape = None
+        self._records = 0
+
+        self._buffer = bytearray()
+        self._pending = 0
+        self._deferred = False
+
+        if header:
+            self._file.write(bytes(NPY_HEADER_SIZE))
+
+    def set_register(self, qubits, bindings):
+        """
+        Sets the number of qubits of the register and the parameter values of every register of a batch (or None
+        for a single register)
+
+        :param qubits: (integer)
+        :param bindings: parameter values keyed by name, per register (list)
+        :return: (None)
+        """
+
+        self._width = (qubits + 7) // 8
+        self._registers = () if bindings is None else (len(bindings),)
+
+    def write_measurement(self, row, observation):
+        """
+        Writes the measurement :param observation of register :param row
+
+        :param row: (integer)
+        :param observation: (string)
+        :return: (None)
+        """
+
+        self._shape = self._registers + (self._width,)
+        self._buffer += self._pack(observation)
+        self._advance(1 if not self._registers or row == self._registers[0] - 1 else 0)
+
+    def write_histogram(self, row, observations, count):
+        """
+        Writes the histogram entry of register :param row
+
+        :param row: (integer)
+        :param observations: (tuple)
+        :param count: (integer)
+        :return: (None)
+        """
+
+        self._dtype = numpy.dtype([
+            ("register", "<u4"), ("measurements", numpy.uint8, (len(observations), self._width)), ("count", "<u8")
+        ])
+        self._shape = ()
+        self._buffer += struct.pack("<I", row)
+        for observation in observations:
+            self._buffer += self._pack(observation)
+        self._buffer += struct.pack("<Q", count)
+        self._advance(1)
+
+    def _pack(self, observation):
+        """
+        Returns the bits of the observation :param observation packed into bytes.
+        If :param observation is not a basis state -> ValueError raised.
+
+        :param observation: (string)
+        :return: (bytes)
+        """
+
+        match = regular_expression.search(OBSERVATION_REGEX, observation)
+        if not match:
+            raise ValueError("{0} is not an observation of a basis state".format(observation))
+
+        bits = match.group(1)
+        return (int(bits, 2) << (self._width * 8 - len(bits))).to_bytes(self._width, "big")
+
+    def _advance(self, records):
+        """
+        Counts :param records completed records, writing the buffer once it is full
+
+        :param records: (integer)
+        :return: (None)
+        """
+
+        self._records += records
+        self._pending += 1
+
+        if self._pending >= SINK_BUFFER_SIZE and not self._deferred:
+            self.flush()
+
+    def set_deferred(self, deferred):
+        """
+        Sets whether the buffered results are only written by an explicit flush (e.g. at a checkpoint), however many
+        there are, instead of whenever the buffer is full
+
+        :param deferred: (boolean)
+        :return: (None)
+        """
+
+        self._deferred = deferred
+
+    def get_offset(self):
+        """
+        Returns the offset of the end of the results written to the file, or None for standard output
+
+        :return: (integer)
+        """
+
+        return self._file.tell() if self._owned else None
+
+    def truncate(self, offset):
+        """
+        Removes the results written to the file after :param offset, e.g. those written after the checkpoint an
+        execution resumes from. A file shorter than :param offset is left as it is.
+
+        :param offset: (integer)
+        :return: (None)
+        """
+
+        if self._owned:
+            self._file.seek(0, 2)
+            self._file.truncate(min(offset, self._file.tell()))
+
+    def flush(self):
+        """
+        Writes the buffered results
+
+        :return: (None)
+        """
+
+        self._file.write(self._buffer)
+        self._file.flush()
+
+        self._buffer = bytearray()
+        self._pending = 0
+
+    def close(self):
+        """
+        Writes the buffered results, completes the .npy header and closes the file
+
+        :return: (None)
+        """
+
+        self.flush()
+
+        if self._header:
+            shape = self._registers + (self._width,) if self._shape is None else self._shape
+            header = "{{'descr': {0!r}, 'fortran_order': False, 'shape': {1!r}, }}".format(
+                numpy.lib.format.dtype_to_descr(self._dtype), (self._records,) + shape
+            )
+
+            self._file.seek(0)
+            self._file.write(b"\x93NUMPY\x01\x00" + struct.pack("<H", NPY_HEADER_SIZE - 10))
+            self._file.write(header.ljust(NPY_HEADER_SIZE - 11).encode("latin1") + b"\n")
+
+        if self._owned:
+            self._file.close()
@@ -0,0 +1,87 @@
+import re as regular_expression
+import json
+
+from qasm.helpers.Constants import OBSERVATION_REGEX
+from qasm.bridge.sink.TextSink import TextSink
+
+
+class JsonSink(TextSink):
+
+    def __init__(self, file_location=None, append=False):
+        """
+        JsonSink constructor.
+        Result sink writing one JSON object per line (JSON Lines): {"measurement": "0101"} for every measurement
+        and {"measurements": ["0101"], "count": 10} for every histogram entry. Measurements are given as the bits of
+        the register, qubit 1 first, and the measurements of a parameter sweep carry a "binding" object.
+
+        :param file_location: path of the file the results are written to (default: standard output) (string)
+        :param append: whether to append to the file instead of replacing it, e.g. when resuming (boolean)
+        """
+
+        super().__init__(file_location, append)
+        self._bindings = None
+
+    def set_register(self, qubits, bindings):
+        """
+        Sets the number of qubits of the register and the parameter values of every register of a batch (or None
+        for a single register)
+
+        :param qubits: (integer)
+        :param bindings: parameter values keyed by name, per register (list)
+        :return: (None)
+        """
+
+        self._bindings = None if bindings is None else [
+            {name: float(value) for name, value in binding.items()} for binding in bindings
+        ]
+
+    def write_measurement(self, row, observation):
+        """
+        Writes the measurement :param observation of register :param row
+
+        :param row: (integer)
+        :param observation: (string)
+        :return: (None)
+        """
+
+        self._write(self._object(row, {"measurement": self._bits(observation)}))
+
+    def write_histogram(self, row, observations, count):
+        """
+        Writes the histogram entry of register :param row
+
+        :param row: (integer)
+        :param observations: (tuple)
+        :param count: (integer)
+        :return: (None)
+        """
+
+        self._write(self._object(row, {
+            "measurements": [self._bits(observation) for observation in observations], "count": count
+        }))
+
+    def _object(self, row, result):
+        """
+        Returns :param result as a JSON object, with the parameter values of register :param row when parameters are
+        swept
+
+        :param row: (integer)
+        :param result: (dict)
+        :return: (string)
+        """
+
+        if self._bindings is not None:
+            result["binding"] = self._bindings[row]
+
+        return json.dumps(result)
+
+    def _bits(self, observation):
+        """
+        Returns the bits of the observation :param observation, or the observation itself if it is not a basis state
+
+        :param observation: (string)
+        :return: (string)
+        """
+
+        match = regular_expression.search(OBSERVATION_REGEX, observation)
+        return match.group(1) if match else observation
@@ -0,0 +1,147 @@
+import sys
+
+from qasm.helpers.Constants import SINK_BUFFER_SIZE
+
+
+class TextSink:
+
+    def __init__(self, file_location=None, append=False):
+        """
+        TextSink constructor.
+        Result sink writing every measurement as a "|psi> = |...>" line, and every histogram entry as the
+        measurements of a run followed by their count. Measurements of a parameter sweep are labelled with their
+        binding. Lines are buffered and written in blocks instead of one print per measurement.
+
+        :param file_location: path of the file the results are written to (default: standard output) (string)
+        :param append: whether to append to the file instead of replacing it, e.g. when resuming (boolean)
+        """
+
+        self._file = sys.stdout if file_location is None else open(file_location, "a" if append else "w")
+        self._owned = file_location is not None
+
+        self._labels = None
+        self._lines = []
+        self._deferred = False
+
+    def set_register(self, qubits, bindings):
+        """
+        Sets the number of qubits of the register and the parameter values of every register of a batch (or None
+        for a single register)
+
+        :param qubits: (integer)
+        :param bindings: parameter values keyed by name, per register (list)
+        :return: (None)
+        """
+
+        self._labels = None if bindings is None else [
+            ", ".join("{0}={1:g}".format(name, value) for name, value in binding.items()) for binding in bindings
+        ]
+
+    def write_measurement(self, row, observation):
+        """
+        Writes the measurement :param observation of register :param row
+
+        :param row: (integer)
+        :param observation: (string)
+        :return: (None)
+        """
+
+        self._write(self._label(row, observation))
+
+    def write_histogram(self, row, observations, count):
+        """
+        Writes the histogram entry of register :param row: the measurements :param observations of a run and the
+        number of runs that made them
+
+        :param row: (integer)
+        :param observations: (tuple)
+        :param count: (integer)
+        :return: (None)
+        """
+
+        self._write(self._label(row, "{0}: {1}".format(", ".join(observations), count)))
+
+    def _label(self, row, output):
+        """
+        Labels :param output with the parameter values of register :param row when parameters are swept
+
+        :param row: (integer)
+        :param output: (string)
+        :return: (string)
+        """
+
+        if self._labels is None:
+            return output
+
+        return "{0}: {1}".format(self._labels[row], output)
+
+    def _write(self, line):
+        """
+        Buffers :param line, writing the buffer once it is full
+
+        :param line: (string)
+        :return: (None)
+        """
+
+        self._lines.append(line)
+
+        if len(self._lines) >= SINK_BUFFER_SIZE and not self._deferred:
+            self.flush()
+
+    def set_deferred(self, deferred):
+        """
+        Sets whether the buffered results are only written by an explicit flush (e.g. at a checkpoint), however many
+        there are, instead of whenever the buffer is full
+
+        :param deferred: (boolean)
+        :return: (None)
+        """
+
+        self._deferred = deferred
+
+    def get_offset(self):
+        """
+        Returns the offset of the end of the results written to the file, or None for standard output
+
+        :return: (integer)
+        """
+
+        return self._file.tell() if self._owned else None
+
+    def truncate(self, offset):
+        """
+        Removes the results written to the file after :param offset, e.g. those written after the checkpoint an
+        execution resumes from. A file shorter than :param offset is left as it is.
+
+        :param offset: (integer)
+        :return: (None)
+        """
+
+        if self._owned:
+            self._file.seek(0, 2)
+            self._file.truncate(min(offset, self._file.tell()))
+
+    def flush(self):
+        """
+        Writes the buffered results
+
+        :return: (None)
+        """
+
+        if self._lines:
+            self._file.write("\n".join(self._lines) + "\n")
+            self._lines = []
+
+        self._file.flush()
+
+    def close(self):
+        """
+        Writes the buffered results and closes the file
+
+        :return: (None)
+        """
+
+        self.flush()
+
+        if self._owned:
+            self._file.close()
@@ -1,34 +1,420 @@
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout, redirect_stderr
+from importlib import import_module
+import re as regular_expression
+import hashlib
+import glob
 import sys
+import io
+import os
 
+import numpy
+
+from qasm.helpers.Constants import (
+    INTEGER_REGEX, SWEEP_REGEX, OUTPUT_REGEX, PARALLEL_CHUNK_SIZE, SELECTABLE_BACKENDS, PRECISIONS, NORM_TOLERANCE,
+    SINKS
+)
+from qasm.helpers.Exceptions import QASMArgumentException
+from qasm.compiler.ParallelCompiler import ParallelCompiler
 from qasm.commands.Command import Command
 from qasm.helpers.Util import read_file
+from qasm.compiler.GateFusion import GateFusion
+from qasm.compiler.Peephole import Peephole
+from qasm.compiler.Compiler import Compiler
+from qasm.compiler.Cache import Cache
 from qasm.parser.Parser import Parser
+from qasm.lexer.FileLexer import FileLexer
 from qasm.lexer.Lexer import Lexer
 from qasm.bridge.Bridge import Bridge
+from qasm.bridge.Checkpoint import Checkpoint
 from qasm.bridge.config.QuantumComputerConfig import QuantumComputerConfig
+from qasm import __version__
 
 
 class Execute(Command):
 
     def __init__(self, arguments):
         super().__init__(arguments)
-        self._file_location = self._arguments["<file>"]
+        self._file_locations = self._arguments["<file>"]
+        self._jobs = self._arguments["--jobs"]
+        self._backend = self._arguments["--backend"]
+        self._opt_level = self._arguments["--opt-level"]
+        self._shots = self._arguments["--shots"]
+        self._sweep = self._arguments["--sweep"]
+        self._precision = self._arguments["--precision"]
+        self._threads = self._arguments["--threads"]
+        self._output = self._arguments["--output"]
+        self._checkpoint_every = self._arguments["--checkpoint-every"]
+        self._resume = self._arguments["--resume"]
+
+        self._qubits = None
+        self._checkpoint = None
+        self._default_backend = False
 
     def run(self):
-        errors, bridge_errors = self._run(read_file(self._file_location))
+        if not self._validate_arguments():
+            sys.exit(64)
+
+        file_locations = self._expand(self._file_locations)
+
+        format, output_location = self._output
+        if len(file_locations) > 1 and (output_location is not None or format not in ("text", "jsonl")):
+            self._argument_error(
+                "results of several programs can only be written to standard output", "text|jsonl", "output",
+                self._arguments["--output"]
+            )
+            sys.exit(64)
+
+        if len(file_locations) == 1:
+            status = self._execute_file(file_locations[0])
+        else:
+            status = self._execute_batch(file_locations)
+
+        if status:
+            sys.exit(status)
+
+    def _execute_file(self, file_location):
+        self._checkpoint = None
+
+        if self._arguments["--stream"]:
+            errors, bridge_errors = self._run_stream(file_location)
+        else:
+            errors, bridge_errors = self._run(read_file(file_location))
 
         if errors:
-            sys.exit(65)
+            return 65
 
         if bridge_errors:
-            sys.exit(70)
+            return 70
+
+        return 0
+
+    def _execute_batch(self, file_locations):
+        """
+        Executes many programs on a pool of worker processes, which import the interpreter and read the config once.
+        Files with identical contents are executed once. The output and errors of every file are printed in the order
+        the files were given, each under a header naming the file.
+
+        :param file_locations: paths of the programs (list)
+        :return: exit status (integer)
+        """
+
+        programs, representatives = [], {}
+        for file_location in file_locations:
+            programs.append(representatives.setdefault(self._digest(file_location), file_location))
+
+        unique = list(representatives.values())
+        jobs = min(self._jobs, len(unique))
+
+        self._get_qubits()
+        self._jobs = 1
+
+        with ProcessPoolExecutor(jobs) as executor:
+            results = dict(zip(unique, executor.map(
+                self._execute_captured, unique, chunksize=max(1, len(unique) // (jobs * 4))
+            )))
+
+        statuses = set()
+        for file_location, representative in zip(file_locations, programs):
+            stdout, stderr, status = results[representative]
+
+            print("==> {0} <==".format(file_location))
+            print(stdout, end="", flush=True)
+            print(stderr, end="", file=sys.stderr, flush=True)
+
+            statuses.add(status)
+
+        return min(statuses - {0}, default=0)
+
+    def _execute_captured(self, file_location):
+        """
+        Executes the program stored at :param file_location, capturing everything it prints. Runs in a worker process.
+
+        :param file_location: (string)
+        :return: standard output, standard error and exit status (tuple)
+        """
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            status = self._execute_file(file_location)
+
+        return stdout.getvalue(), stderr.getvalue(), status
+
+    def _expand(self, file_locations):
+        """
+        Expands directories to the .qasm files they contain and glob patterns to the files they match, in sorted
+        order. Arguments that match nothing are kept, so that they are reported as missing.
+
+        :param file_locations: (list)
+        :return: (list)
+        """
+
+        expanded = []
+        for file_location in file_locations:
+            if os.path.isdir(file_location):
+                expanded.extend(sorted(glob.glob(os.path.join(file_location, "*.qasm"))))
+            else:
+                expanded.extend(sorted(glob.glob(file_location)) or [file_location])
+
+        return expanded
+
+    def _digest(self, file_location):
+        """
+        Returns the content hash of the file stored at :param file_location, or the path if it can not be read
+
+        :param file_location: (string)
+        :return: (string)
+        """
+
+        try:
+            with open(file_location, "rb") as file:
+                return hashlib.sha256(file.read()).hexdigest()
+        except OSError:
+            return file_location
+
+    def _get_qubits(self):
+        if self._qubits is None:
+            self._qubits = QuantumComputerConfig.get_qubits()
+
+        return self._qubits
+
+    def _validate_arguments(self):
+        if not regular_expression.match(INTEGER_REGEX, self._jobs) or not int(self._jobs):
+            return self._argument_error("invalid number of jobs", "[1-9][0-9]*", "jobs", self._jobs)
+
+        if not regular_expression.match(INTEGER_REGEX, self._opt_level):
+            return self._argument_error("invalid optimisation level", "[0-9]+", "opt-level", self._opt_level)
+
+        if self._shots is not None:
+            if not regular_expression.match(INTEGER_REGEX, self._shots) or not int(self._shots):
+                return self._argument_error("invalid number of shots", "[1-9][0-9]*", "shots", self._shots)
+
+            if self._arguments["--stream"]:
+                return self._argument_error("shots can not be streamed", "--shots | --stream", "shots", self._shots)
+
+            self._shots = int(self._shots)
+
+        if self._backend is None:
+            self._backend = QuantumComputerConfig.get_backend()
+            self._default_backend = "backend" not in QuantumComputerConfig.get_config()
+
+        if self._backend not in SELECTABLE_BACKENDS:
+            return self._argument_error("unknown backend", "|".join(SELECTABLE_BACKENDS), "backend", self._backend)
+
+        if self._sweep is not None and not self._validate_sweep():
+            return False
+
+        if not self._validate_precision():
+            return False
+
+        if not regular_expression.match(INTEGER_REGEX, self._threads) or not int(self._threads):
+            return self._argument_error("invalid number of threads", "[1-9][0-9]*", "threads", self._threads)
+
+        self._threads = int(self._threads)
+        if self._threads > 1 and not hasattr(Bridge.get_backend(self._backend), "get_threads"):
+            return self._argument_error(
+                "backend can not apply gates on threads", "statevector", "backend", self._backend
+            )
+
+        if not self._validate_output():
+            return False
+
+        if not self._validate_checkpoint():
+            return False
+
+        self._jobs, self._opt_level = int(self._jobs), int(self._opt_level)
+        return True
+
+    def _validate_sweep(self):
+        """
+        Parses the parameter bindings of --sweep, e.g. theta=0:6.28:1000,phi=0.5. A parameter is bound either to one
+        value or to count evenly spaced values from start to stop (inclusive). Every swept parameter must have the
+        same count, and sweeping requires a backend that can run a batch of registers.
+
+        :return: (boolean)
+        """
+
+        bindings, counts = {}, set()
+        for binding in self._sweep.split(","):
+            match = regular_expression.match(SWEEP_REGEX, binding.strip())
+
+            try:
+                name, start, stop, count = match.groups()
+                if stop is None:
+                    bindings[name] = float(start)
+                else:
+                    bindings[name] = numpy.linspace(float(start), float(stop), int(count))
+                    counts.add(int(count))
+            except (AttributeError, ValueError):
+                return self._argument_error(
+                    "invalid parameter binding", "<name>=<value>|<name>=<start>:<stop>:<count>", "sweep", binding
+                )
+
+        if len(counts) > 1:
+            return self._argument_error(
+                "swept parameters must have the same number of values", "<name>=<start>:<stop>:<count>", "sweep",
+                self._sweep
+            )
+
+        if counts and not hasattr(Bridge.get_backend(self._backend), "get_batch"):
+            return self._argument_error("backend can not sweep parameters", "statevector", "backend", self._backend)
+
+        self._sweep = bindings
+        return True
+
+    def _validate_precision(self):
+        """
+        Validates --precision, or takes the precision from the config. Single precision requires a backend that
+        supports it; a precision set in the config only applies to such backends.
+
+        :return: (boolean)
+        """
+
+        precision = self._precision
+        if precision is None:
+            precision = QuantumComputerConfig.get_precision()
+
+        if precision not in PRECISIONS:
+            return self._argument_error("unknown precision", "|".join(PRECISIONS), "precision", precision)
+
+        if self._precision == "single" and not hasattr(Bridge.get_backend(self._backend), "get_precision"):
+            return self._argument_error(
+                "backend does not support single precision", "statevector", "backend", self._backend
+            )
+
+        self._precision = precision
+        return True
+
+    def _validate_output(self):
+        """
+        Parses --output, e.g. jsonl or npy:results.npy: the format of the result sink, a key of SINKS, and the file
+        the results are written to (default: standard output). A .npy file needs a file, as its header is completed
+        once every result is written.
+
+        :return: (boolean)
+        """
+
+        match = regular_expression.match(OUTPUT_REGEX, self._output)
+        if not match or match.group(1) not in SINKS:
+            return self._argument_error(
+                "invalid output", "({0})[:<file>]".format("|".join(SINKS)), "output", self._output
+            )
+
+        if match.group(1) == "npy" and match.group(2) is None:
+            return self._argument_error("npy output needs a file", "npy:<file>", "output", self._output)
+
+        self._output = match.groups()
+        return True
+
+    def _validate_checkpoint(self):
+        """
+        Validates --checkpoint-every and --resume. Checkpoints hold the statevector, so they require a backend that
+        exposes it, and a resumed execution appends to its output, which a .npy file does not allow.
+
+        :return: (boolean)
+        """
+
+        if self._checkpoint_every is not None:
+            if not regular_expression.match(INTEGER_REGEX, self._checkpoint_every) or not int(self._checkpoint_every):
+                return self._argument_error(
+                    "invalid checkpoint interval", "[1-9][0-9]*", "checkpoint-every", self._checkpoint_every
+                )
+
+            self._checkpoint_every = int(self._checkpoint_every)
+
+        if self._checkpoint_every is None and not self._resume:
+            return True
+
+        if not hasattr(Bridge.get_backend(self._backend), "get_state"):
+            return self._argument_error(
+                "backend can not checkpoint its register", "statevector|memmap|shared", "backend", self._backend
+            )
+
+        if self._resume and self._output[0] == "npy":
+            return self._argument_error(
+                "npy output can not be resumed", "(text|jsonl|raw)[:<file>]", "output", self._arguments["--output"]
+            )
+
+        return True
+
+    def _open_checkpoint(self, program):
+        """
+        Returns the checkpoints of the executed program with hash :param program, or None without --checkpoint-every
+        and --resume. They are named by a hash of the program and of every option its execution depends on, so an
+        execution only resumes from the checkpoints of the same program run the same way. A compiled program is
+        hashed by its tape (see qasm.compiler.Tape.Tape.get_digest), the stream that checkpoint indices refer to, so
+        a tape compiled differently (e.g. in parallel chunks) never resumes from the checkpoints of another.
+        A streamed program is hashed by its source, as its statements are the stream.
+
+        :param program: (string)
+        :return: (qasm.bridge.Checkpoint.Checkpoint)
+        """
+
+        if self._checkpoint_every is None and not self._resume:
+            return None
+
+        digest = hashlib.sha256()
+        for option in (
+            __version__, program, self._get_qubits(), self._backend, self._arguments["--shots"],
+            self._arguments["--sweep"], self._precision, self._arguments["--stream"]
+        ):
+            digest.update("{0}\0".format(option).encode("utf-8"))
+
+        checkpoint = Checkpoint(digest.hexdigest(), self._checkpoint_every, self._resume)
+        if checkpoint.get_resumed() is not None:
+            print("[INFO] Info: QASMCheckpoint, Response: (Resumed at: {0})".format(
+                checkpoint.get_resumed()
+            ), file=sys.stderr)
+
+        return checkpoint
+
+    def _open_sink(self):
+        """
+        Returns a new result sink, writing to the file of --output. A resumed execution appends to the file.
+
+        :return: (qasm.bridge.sink.TextSink.TextSink | qasm.bridge.sink.BinarySink.BinarySink)
+        """
+
+        format, file_location = self._output
+        module, sink, options = SINKS[format]
+
+        append = self._checkpoint is not None and self._checkpoint.get_resumed() is not None
+        return getattr(import_module(module), sink)(file_location, append=append, **options)
+
+    def _argument_error(self, message, format, name, value):
+        print(QASMArgumentException({
+            "message": message,
+            "format": format,
+            name: value
+        }), file=sys.stderr)
+
+        return False
 
     def _run(self, source):
 
         lexer_errors, parser_errors, bridge_errors = [], [], []
 
+        qubits = self._get_qubits() if self._opt_level >= 1 else None
+
+        cache = None if self._arguments["--no-cache"] else Cache()
+        key = cache.key(source, *(() if qubits is None else ("peephole", qubits))) if cache else None
+
+        tape = cache.load(key) if cache else None
+        if tape is not None:
+            return self._execute(tape)
+
+        if self._jobs > 1 and len(source) > PARALLEL_CHUNK_SIZE:
+            compiler = ParallelCompiler(source, self._jobs, qubits)
+            tape = compiler.compile()
+            if tape is not None:
+                if cache:
+                    cache.store(key, tape)
+
+                return self._execute(tape)
+
         lexer = Lexer(source)
-        tokens = lexer.scan_tokens()
+        tokens = lexer.scan_buffer()
 
         lexer_errors = lexer.get_errors()
         self._print_errors(lexer_errors)
@@ -44,15 +430,167 @@ class Execute(Command):
         if parser_errors:
             return lexer_errors + parser_errors, bridge_errors
 
+        eliminated = 0
+        if qubits is not None:
+            peephole = Peephole(statements, qubits)
+            statements = peephole.optimise()
+            eliminated = peephole.get_eliminated()
+
+        tape = Compiler(statements, eliminated).compile()
+        if cache:
+            cache.store(key, tape)
+
+        return self._execute(tape)
+
+    def _execute(self, tape):
+        qubits = self._get_qubits()
+        backend = self._backend
+
+        if self._opt_level >= 1:
+            self._print_optimisation("peephole", tape.get_eliminated())
+
+        checkpointing = self._checkpoint_every is not None or self._resume
+        if not checkpointing and (backend != "external" or self._default_backend) and tape.is_classical():
+            backend = "classical"
+
+        if self._opt_level >= 1 and hasattr(Bridge.get_backend(backend), "U"):
+            fusion = GateFusion(tape, qubits)
+            tape = fusion.optimise()
+            self._print_optimisation("gate fusion", fusion.get_eliminated())
+
+        self._checkpoint = self._open_checkpoint(tape.get_digest())
+
+        sink = self._open_sink()
         bridge = Bridge(
-            statements, QuantumComputerConfig.get_qubits()
+            tape, qubits, backend, self._shots, self._sweep, self._get_precision(backend), self._get_threads(backend),
+            sink, self._checkpoint
         )
 
         bridge.execute()
+        sink.close()
+
+        self._print_drift(bridge)
+
         bridge_errors = bridge.get_errors()
 
         self._print_errors(bridge_errors)
-        return lexer_errors + parser_errors, bridge_errors
+        return [], bridge_errors
+
+    def _get_precision(self, backend):
+        """
+        Returns the precision to run :param backend in, or None if it does not support a choice of precision
+
+        :param backend: a key of BACKENDS (string)
+        :return: (string)
+        """
+
+        return self._precision if hasattr(Bridge.get_backend(backend), "get_precision") else None
+
+    def _get_threads(self, backend):
+        """
+        Returns the number of threads to apply the gates of :param backend on, or None if it does not support threads
+
+        :param backend: a key of BACKENDS (string)
+        :return: (integer)
+        """
+
+        return self._threads if hasattr(Bridge.get_backend(backend), "get_threads") else None
+
+    def _run_stream(self, file_location):
+        """
+        Lexes, parses and executes the program as a pipeline: statements are executed as soon as they are parsed
+        and neither the source, the tokens nor the statements are held in memory. Execution stops at the first lexer
+        or parser error; the rest of the program is still analysed so that every error is reported, stage by stage as
+        in a buffered run.
+        With --validate the whole program is analysed before anything is executed.
+
+        :param file_location: path of the program (string)
+        :return: (tuple)
+        """
+
+        if self._arguments["--validate"]:
+            lexer = self._open_lexer(file_location)
+            parser = Parser(lexer.iter_tokens())
+
+            for _ in parser.iter_statements():
+                pass
+
+            errors = self._front_end_errors(lexer, parser)
+            self._print_errors(errors)
+            if errors:
+                return errors, []
+
+        lexer = self._open_lexer(file_location)
+        parser = Parser(lexer.iter_tokens())
+        statements = parser.iter_statements()
+
+        self._checkpoint = self._open_checkpoint(self._digest(file_location))
+
+        sink = self._open_sink()
+        bridge = Bridge(
+            self._until_error(statements, lexer, parser), self._get_qubits(), self._backend, bindings=self._sweep,
+            precision=self._get_precision(self._backend), threads=self._get_threads(self._backend), sink=sink,
+            checkpoint=self._checkpoint
+        )
+
+        bridge.execute()
+        sink.close()
+
+        self._print_drift(bridge)
+
+        for _ in statements:
+            pass
+
+        errors = self._front_end_errors(lexer, parser)
+        self._print_errors(errors)
+
+        bridge_errors = bridge.get_errors()
+        self._print_errors(bridge_errors)
+        return errors, bridge_errors
+
+    def _open_lexer(self, file_location):
+        try:
+            return FileLexer(file_location)
+        except FileNotFoundError:
+            return Lexer(read_file(file_location))
+
+    def _front_end_errors(self, lexer, parser):
+        """
+        Returns the errors of a streamed program, stage by stage as a buffered run reports them: the lexer errors if
+        there are any, as the parser errors they cause are not reported, otherwise the parser errors
+
+        :param lexer: (qasm.lexer.Lexer.Lexer | qasm.lexer.FileLexer.FileLexer)
+        :param parser: (qasm.parser.Parser.Parser)
+        :return: (list)
+        """
+
+        return lexer.get_errors() or parser.get_errors()
+
+    def _until_error(self, statements, lexer, parser):
+        for statement in statements:
+            if lexer.get_errors() or parser.get_errors():
+                return
+
+            yield statement
+
+    def _print_optimisation(self, optimisation, eliminated):
+        print("[INFO] Info: QASMOptimiser, Response: (Pass: {0}, Gates eliminated: {1})".format(
+            optimisation, eliminated
+        ), file=sys.stderr)
+
+    def _print_drift(self, bridge):
+        """
+        Reports the drift of the norm of the register if it exceeds the tolerance of the precision
+
+        :param bridge: (qasm.bridge.Bridge.Bridge)
+        :return: (None)
+        """
+
+        drift = bridge.get_drift()
+        if drift is not None and drift > NORM_TOLERANCE[self._precision]:
+            print("[WARNING] Warning: QASMPrecision, Response: (Precision: {0}, Norm drift: {1:.3e})".format(
+                self._precision, drift
+            ), file=sys.stderr)
 
     def _print_errors(self, errors):
         for error in errors:
@@ -0,0 +1,173 @@
+import hashlib
+import tempfile
+import zipfile
+import os
+
+import numpy
+
+from qasm.helpers.Constants import CACHE_DIRECTORY, USER_CACHE_DIRECTORY, CACHE_SIZE, SYNTAX_JSON
+from qasm.compiler.Tape import Tape, TAPE_DTYPE
+from qasm.helpers.Util import read_file, writable_directory
+from qasm import __version__
+
+
+CACHE_FORMAT = 5
+
+
+class Cache:
+    """
+    Cache Class
+    On-disk cache of compiled programs, similar to __pycache__. Tapes are stored as .npz files named by a hash of the
+    source, the grammar and the version, so a program only has to be lexed, parsed and compiled once.
+    The cache is best effort: any failure to read or write it behaves like a miss, and unreadable entries are removed.
+    """
+
+    def __init__(self, directory=None, size=CACHE_SIZE):
+        """
+        Cache constructor
+
+        :param directory: directory holding the cached tapes (default: CACHE_DIRECTORY, inside the package, or
+                          USER_CACHE_DIRECTORY if the package can not be written to) (string)
+        :param size: size in bytes above which the least recently used tapes are evicted (integer)
+        """
+
+        self._directory = directory or writable_directory(CACHE_DIRECTORY, USER_CACHE_DIRECTORY)
+        self._size = size
+
+    def key(self, source, *options):
+        """
+        Returns the cache key of :param source
+
+        :param source: assembly source code (string)
+        :param options: compilation options that change the tape produced (strings)
+        :return: (string)
+        """
+
+        digest = hashlib.sha256()
+        digest.update("{0}\0{1}\0".format(__version__, CACHE_FORMAT).encode("utf-8"))
+        digest.update(read_file(SYNTAX_JSON).encode("utf-8"))
+
+        for option in options:
+            digest.update("\0{0}".format(option).encode("utf-8"))
+
+        digest.update(b"\0")
+        digest.update(source.encode("utf-8"))
+
+        return digest.hexdigest()
+
+    def load(self, key):
+        """
+        Returns the tape stored under :param key, or None on a miss.
+        An entry that can not be read (e.g. truncated or corrupt) is removed, so the program is compiled again.
+
+        :param key: (string)
+        :return: (qasm.compiler.Tape.Tape)
+        """
+
+        path = self._path(key)
+
+        try:
+            with numpy.load(path, allow_pickle=False) as archive:
+                instructions = archive["instructions"]
+                parameters = archive["parameters"].tolist()
+                eliminated = int(archive["eliminated"])
+                lexemes = dict(zip(archive["lexeme_rows"].tolist(), archive["lexemes"].tolist()))
+
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+            self._remove(path)
+            return None
+
+        if instructions.dtype != TAPE_DTYPE or instructions.ndim != 1:
+            self._remove(path)
+            return None
+
+        return Tape(instructions, parameters=parameters, eliminated=eliminated, lexemes=lexemes)
+
+    def store(self, key, tape):
+        """
+        Stores :param tape under :param key.
+        The tape is written to a temporary file which is then atomically renamed, so concurrent writers and readers
+        never see a partial file. Tapes holding qubit tokens that do not fit the qubit column are not cached.
+
+        :param key: (string)
+        :param tape: (qasm.compiler.Tape.Tape)
+        :return: (None)
+        """
+
+        if tape.get_overflow():
+            return
+
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+
+            descriptor, temporary = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+            try:
+                with os.fdopen(descriptor, "wb") as file:
+                    numpy.savez(
+                        file,
+                        instructions=tape.get_instructions(),
+                        parameters=numpy.array(tape.get_parameters(), dtype=str),
+                        eliminated=numpy.array(tape.get_eliminated()),
+                        lexeme_rows=numpy.array(list(tape.get_lexemes()), dtype=numpy.int64),
+                        lexemes=numpy.array(list(tape.get_lexemes().values()), dtype=str)
+                    )
+
+                os.replace(temporary, self._path(key))
+            except BaseException:
+                self._remove(temporary)
+                raise
+
+            self._evict()
+        except OSError:
+            return
+
+    def _evict(self):
+        """
+        Removes the least recently used tapes until the cache fits in its size bound
+
+        :return: (None)
+        """
+
+        entries = []
+        for entry in os.scandir(self._directory):
+            if entry.name.endswith(".npz"):
+                try:
+                    status = entry.stat()
+                except OSError:
+                    continue
+
+                entries.append((status.st_mtime, status.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self._size:
+                return
+
+            self._remove(path)
+            total -= size
+
+    def _path(self, key):
+        """
+        Returns the path of the tape stored under :param key
+
+        :param key: (string)
+        :return: (string)
+        """
+
+        return os.path.join(self._directory, "{0}.npz".format(key))
+
+    def _remove(self, path):
+        """
+        Removes :param path, ignoring files that have already been removed (e.g. by another process)
+
+        :param path: (string)
+        :return: (None)
+        """
+
+        try:
+            os.remove(path)
+        except OSError:
+            pass
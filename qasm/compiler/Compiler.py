@@ -0,0 +1,176 @@
+from array import array
+
+import numpy
+
+from qasm.compiler.Tape import Tape, TAPE_DTYPE, QUBIT_OVERFLOW
+from qasm.parser.Statement import StatementVisitor
+from qasm.lexer.TokenType import TokenType
+
+
+class Compiler(StatementVisitor):
+
+    def __init__(self, statements, eliminated=0):
+        """
+        Compiler constructor.
+        Lowers qasm.parser.Statement.Statement objects to an instruction tape (qasm.compiler.Tape.Tape).
+
+        :param statements: statements produced by the parser (iterable)
+        :param eliminated: number of gates the peephole pass removed from :param statements, recorded on the tape
+                           (integer)
+        """
+
+        self._statements = statements
+        self._eliminated = eliminated
+
+        self._opcodes = array("B")
+        self._qubits = array("L")
+        self._angles = array("d")
+        self._operands = array("L")
+        self._lines = array("L")
+
+        self._overflow = {}
+        self._lexemes = {}
+        self._parameters = {}
+
+    def compile(self):
+        """
+        Lowers every statement to a row of the instruction tape
+
+        :return: (qasm.compiler.Tape.Tape)
+        """
+
+        for statement in self._statements:
+            statement.accept(self)
+
+        instructions = numpy.empty(len(self._opcodes), dtype=TAPE_DTYPE)
+        instructions["opcode"] = numpy.frombuffer(self._opcodes, dtype=numpy.uint8)
+        instructions["qubit"] = self._qubits
+        instructions["angle"] = numpy.frombuffer(self._angles, dtype=numpy.float64)
+        instructions["operand"] = self._operands
+        instructions["line"] = self._lines
+
+        return Tape(
+            instructions, self._overflow, parameters=list(self._parameters), eliminated=self._eliminated,
+            lexemes=self._lexemes
+        )
+
+    def _emit(self, type, qubit, angle, line, operand=0):
+        """
+        Appends an instruction to the tape columns
+
+        :param type: instruction token type (qasm.lexer.TokenType.TokenType)
+        :param qubit: qubit index (integer)
+        :param angle: phase shift angle (float)
+        :param line: source line of the instruction (integer)
+        :param operand: parameter of a phase shift, plus one, or 0 (integer)
+        :return: (None)
+        """
+
+        self._opcodes.append(type.value)
+        self._qubits.append(qubit)
+        self._angles.append(angle)
+        self._operands.append(operand)
+        self._lines.append(line)
+
+    def _emit_gate(self, type, statement, angle=0.0, operand=0):
+        """
+        Appends a single qubit gate to the tape columns. Qubit indices too large for the qubit column are recorded
+        with their token, and qubits written with leading zeros with their source text, so the bridge can still
+        report them as written.
+
+        :param type: instruction token type (qasm.lexer.TokenType.TokenType)
+        :param statement: (qasm.parser.Statement.Statement)
+        :param angle: phase shift angle (float)
+        :param operand: parameter of a phase shift, plus one, or 0 (integer)
+        :return: (None)
+        """
+
+        qubit = statement.get_qubit()
+        index = qubit.get_literal()
+
+        if index >= QUBIT_OVERFLOW:
+            self._overflow[len(self._opcodes)] = qubit
+            index = QUBIT_OVERFLOW
+        else:
+            lexeme = qubit.get_lexeme()
+            if lexeme[1] == "0" and len(lexeme) > 2:
+                self._lexemes[len(self._opcodes)] = lexeme
+
+        self._emit(type, index, angle, qubit.get_line(), operand)
+
+    def visit_pauli_x_statement(self, statement):
+        """
+        Lowers pauli x gate application to the tape
+
+        :param statement: (qasm.parser.Statement.PauliX)
+        :return: (None)
+        """
+
+        self._emit_gate(TokenType.X, statement)
+
+    def visit_pauli_y_statement(self, statement):
+        """
+        Lowers pauli y gate application to the tape
+
+        :param statement: (qasm.parser.Statement.PauliY)
+        :return: (None)
+        """
+
+        self._emit_gate(TokenType.Y, statement)
+
+    def visit_pauli_z_statement(self, statement):
+        """
+        Lowers pauli z gate application to the tape
+
+        :param statement: (qasm.parser.Statement.PauliZ)
+        :return: (None)
+        """
+
+        self._emit_gate(TokenType.Z, statement)
+
+    def visit_hadamard_statement(self, statement):
+        """
+        Lowers hadamard gate application to the tape
+
+        :param statement: (qasm.parser.Statement.Hadamard)
+        :return: (None)
+        """
+
+        self._emit_gate(TokenType.H, statement)
+
+    def visit_phase_shift_statement(self, statement):
+        """
+        Lowers phase shift gate application to the tape.
+        Parameters are numbered in order of first use.
+
+        :param statement: (qasm.parser.Statement.PhaseShift)
+        :return: (None)
+        """
+
+        phi = statement.get_phi()
+
+        if phi.get_type() == TokenType.PARAMETER:
+            operand = self._parameters.setdefault(phi.get_literal(), len(self._parameters)) + 1
+            self._emit_gate(TokenType.R, statement, operand=operand)
+        else:
+            self._emit_gate(TokenType.R, statement, phi.get_literal())
+
+    def visit_sqrt_not_statement(self, statement):
+        """
+        Lowers sqrt not gate application to the tape
+
+        :param statement: (qasm.parser.Statement.SqrtNot)
+        :return: (None)
+        """
+
+        self._emit_gate(TokenType.SQRT_NOT, statement)
+
+    def visit_measure_statement(self, statement):
+        """
+        Lowers measurement to the tape
+
+        :param statement: (qasm.parser.Statement.Measure)
+        :return: (None)
+        """
+
+        self._emit(TokenType.MEASURE, 0, 0.0, statement.get_instruction().get_line())
@@ -0,0 +1,145 @@
+import numpy
+
+from qasm.compiler.Gates import gate, multiply, is_identity
+from qasm.compiler.Tape import Tape, TAPE_DTYPE, UNITARY
+from qasm.lexer.TokenType import TokenType
+
+
+class GateFusion:
+
+    def __init__(self, tape, qubits):
+        """
+        GateFusion constructor.
+        Optimisation pass over an instruction tape. Every gate acts on a single qubit, so between two MEASUREs the
+        gates on different qubits commute and each qubit's run of gates can be collapsed into one 2 x 2 unitary.
+        The statevector is then touched once per qubit per segment instead of once per gate.
+
+        :param tape: (qasm.compiler.Tape.Tape)
+        :param qubits: number of qubits in the register (integer)
+        """
+
+        self._tape = tape
+        self._qubits = qubits
+
+        self._eliminated = 0
+
+    def optimise(self):
+        """
+        Returns the fused tape.
+        Only the instructions before the first out of range qubit are fused; that instruction and the ones after it
+        are kept as they are, so the bridge executes the same gates and reports the same error as without fusion.
+        Fused gates take the line of the first gate of their run. A phase shift by a parameter has no matrix until it
+        is bound, so it ends the run of its qubit and is kept as it is.
+
+        :return: (qasm.compiler.Tape.Tape)
+        """
+
+        instructions = self._tape.get_instructions()
+        qubits = instructions["qubit"]
+
+        invalid = numpy.flatnonzero(
+            (instructions["opcode"] != TokenType.MEASURE.value) & ((qubits < 1) | (qubits > self._qubits))
+        )
+        end = int(invalid[0]) if len(invalid) else len(instructions)
+
+        rows, unitaries, segment = [], [], {}
+
+        for row in instructions[:end].tolist():
+            opcode, qubit, angle, operand, _ = row
+
+            if opcode == TokenType.MEASURE.value:
+                self._flush(segment, rows, unitaries)
+                rows.append(row)
+                continue
+
+            if opcode == TokenType.R.value and operand:
+                if qubit in segment:
+                    self._fuse(qubit, segment.pop(qubit), rows, unitaries)
+
+                rows.append(row)
+                continue
+
+            matrix = self._matrix(opcode, angle, operand)
+            run = segment.get(qubit, None)
+            if run is None:
+                segment[qubit] = [matrix, 1, row]
+            else:
+                run[0] = multiply(matrix, run[0])
+                run[1] += 1
+
+        self._flush(segment, rows, unitaries)
+
+        gates = numpy.count_nonzero(instructions["opcode"][:end] != TokenType.MEASURE.value)
+        self._eliminated = int(gates) - sum(1 for row in rows if row[0] != TokenType.MEASURE.value)
+
+        fused = numpy.concatenate([numpy.array(rows, dtype=TAPE_DTYPE), instructions[end:]])
+        overflow = {
+            index - end + len(rows): token for index, token in self._tape.get_overflow().items()
+        }
+        lexemes = {
+            index - end + len(rows): lexeme for index, lexeme in self._tape.get_lexemes().items() if index >= end
+        }
+
+        return Tape(
+            fused, overflow, numpy.array(unitaries, dtype=numpy.complex128).reshape(-1, 2, 2),
+            self._tape.get_parameters(), self._tape.get_eliminated(), lexemes
+        )
+
+    def get_eliminated(self):
+        """
+        Returns the number of gates removed by the last call to optimise
+
+        :return: (integer)
+        """
+
+        return self._eliminated
+
+    def _matrix(self, opcode, angle, operand):
+        """
+        Returns the unitary of a tape instruction as a row-major tuple
+
+        :param opcode: (integer)
+        :param angle: (float)
+        :param operand: (integer)
+        :return: (tuple)
+        """
+
+        if opcode == UNITARY:
+            return tuple(self._tape.get_unitaries()[operand].ravel().tolist())
+
+        return gate(opcode, angle)
+
+    def _flush(self, segment, rows, unitaries):
+        """
+        Appends one instruction per qubit of :param segment to :param rows, in order of each qubit's first gate.
+        Runs of a single gate are kept as they are and runs that multiply out to the identity are dropped.
+
+        :param segment: runs of gates keyed by qubit (dict)
+        :param rows: fused instructions (list)
+        :param unitaries: matrices of the fused instructions (list)
+        :return: (None)
+        """
+
+        for qubit, run in segment.items():
+            self._fuse(qubit, run, rows, unitaries)
+
+        segment.clear()
+
+    def _fuse(self, qubit, run, rows, unitaries):
+        """
+        Appends the instruction of the run of gates :param run on :param qubit to :param rows
+
+        :param qubit: (integer)
+        :param run: product of the gates, number of gates and the first instruction of the run (list)
+        :param rows: fused instructions (list)
+        :param unitaries: matrices of the fused instructions (list)
+        :return: (None)
+        """
+
+        matrix, count, row = run
+
+        if count == 1 and row[0] != UNITARY:
+            rows.append(row)
+        elif not is_identity(matrix):
+            rows.append((UNITARY, qubit, 0.0, len(unitaries), row[4]))
+            unitaries.append(matrix)
@@ -0,0 +1,103 @@
+from functools import lru_cache
+import cmath
+import math
+
+import numpy
+
+from qasm.helpers.Constants import GATE_CACHE_SIZE, GATE_ANGLE_SCALE
+from qasm.lexer.TokenType import TokenType
+
+
+SQRT_HALF = 1 / math.sqrt(2)
+
+PHASE_SHIFT = TokenType.R.value
+
+GATES = {
+    TokenType.X.value: (0, 1, 1, 0),
+    TokenType.Y.value: (0, -1j, 1j, 0),
+    TokenType.Z.value: (1, 0, 0, -1),
+    TokenType.H.value: (SQRT_HALF, SQRT_HALF, SQRT_HALF, -SQRT_HALF),
+    TokenType.SQRT_NOT.value: (0.5 + 0.5j, 0.5 - 0.5j, 0.5 - 0.5j, 0.5 + 0.5j)
+}
+
+
+def gate(opcode, angle, dtype=None):
+    """
+    Returns the unitary of a single qubit gate as a row-major (a, b, c, d) tuple, of scalars of :param dtype if given.
+    Phase shift angles are reduced modulo 2 pi and quantized to multiples of 1 / GATE_ANGLE_SCALE, so the unitaries
+    of the angles a program reuses are built once per process and then taken from the cache of cached_gate.
+
+    :param opcode: gate token type value (integer)
+    :param angle: angle of a phase shift gate (float)
+    :param dtype: complex dtype of the entries (numpy.dtype)
+    :return: (tuple)
+    """
+
+    if opcode == PHASE_SHIFT:
+        return cached_gate(opcode, round(angle % math.tau * GATE_ANGLE_SCALE), dtype)
+
+    return cached_gate(opcode, 0, dtype) if dtype is not None else GATES[opcode]
+
+
+@lru_cache(maxsize=GATE_CACHE_SIZE)
+def cached_gate(opcode, step, dtype):
+    """
+    Returns the unitary of a single qubit gate with angle :param step / GATE_ANGLE_SCALE as a row-major tuple.
+    Process-wide least recently used cache, shared by every statement, run and batch job of the process; its hits
+    and misses are reported by cached_gate.cache_info().
+
+    :param opcode: gate token type value (integer)
+    :param step: quantized angle of a phase shift gate (integer)
+    :param dtype: complex dtype of the entries, or None for Python numbers (numpy.dtype)
+    :return: (tuple)
+    """
+
+    if opcode == PHASE_SHIFT:
+        unitary = 1, 0, 0, cmath.exp(1j * step / GATE_ANGLE_SCALE)
+    else:
+        unitary = GATES[opcode]
+
+    if dtype is None:
+        return unitary
+
+    return tuple(numpy.dtype(dtype).type(entry) for entry in unitary)
+
+
+def phase(angle, dtype=None):
+    """
+    Returns the phase e^(i :param angle) that a phase shift gate applies to the amplitudes where its qubit is 1
+
+    :param angle: (float)
+    :param dtype: complex dtype of the phase (numpy.dtype)
+    :return: (complex)
+    """
+
+    return gate(PHASE_SHIFT, angle, dtype)[3]
+
+
+def multiply(left, right):
+    """
+    Returns the product :param left x :param right of two row-major 2 x 2 matrices
+
+    :param left: (tuple)
+    :param right: (tuple)
+    :return: (tuple)
+    """
+
+    a, b, c, d = left
+    e, f, g, h = right
+
+    return a * e + b * g, a * f + b * h, c * e + d * g, c * f + d * h
+
+
+def is_identity(matrix, tolerance=1e-12):
+    """
+    Returns whether :param matrix is the identity up to a global phase
+
+    :param matrix: row-major 2 x 2 matrix (tuple)
+    :param tolerance: (float)
+    :return: (boolean)
+    """
+
+    a, b, c, d = matrix
+    return abs(b) < tolerance and abs(c) < tolerance and abs(a - d) < tolerance and abs(abs(a) - 1) < tolerance
@@ -0,0 +1,164 @@
+from concurrent.futures import ProcessPoolExecutor
+import re as regular_expression
+
+import numpy
+
+from qasm.helpers.Constants import PARALLEL_CHUNK_SIZE
+from qasm.compiler.Compiler import Compiler
+from qasm.compiler.Peephole import Peephole
+from qasm.parser.Statement import Measure
+from qasm.parser.Parser import Parser
+from qasm.lexer.Lexer import Lexer
+from qasm.lexer.TokenType import TokenType
+from qasm.lexer.Token import Token
+from qasm.compiler.Tape import Tape
+
+
+MEASURE_LINE = regular_expression.compile(r"^[ \t]*MEASURE[ \t]*(?:;[^\n]*)?$", regular_expression.MULTILINE)
+
+
+def compile_chunk(source, line, qubits=None, last=True, measured=False):
+    """
+    Lexes, parses and compiles one chunk of a program. Runs in a worker process.
+    Errors are not returned (they are reported by a serial run); only whether the chunk had any. With the peephole
+    pass, a chunk that does not end the program must end on a MEASURE, so that no gate can be rewritten across its
+    end; otherwise it is treated like a chunk with errors.
+
+    :param source: chunk of the assembly source code, ending on a newline (string)
+    :param line: line number of the first line of the chunk (integer)
+    :param qubits: number of qubits in the register, to run the peephole pass over the chunk (integer | None)
+    :param last: whether the chunk ends the program (boolean)
+    :param measured: whether a chunk before this one holds a MEASURE (boolean)
+    :return: (tuple)
+    """
+
+    lexer = Lexer(source, line=line)
+    parser = Parser(lexer.scan_buffer())
+    statements = parser.parse()
+
+    if lexer.get_errors() or parser.get_errors():
+        return None, None, None, None, 0
+
+    if qubits is not None and not last and not (statements and isinstance(statements[-1], Measure)):
+        return None, None, None, None, 0
+
+    eliminated = 0
+    if qubits is not None:
+        peephole = Peephole(statements, qubits, last, measured)
+        statements = peephole.optimise()
+        eliminated = peephole.get_eliminated()
+
+    tape = Compiler(statements).compile()
+    overflow = {
+        index: Token(token.get_type(), token.get_lexeme(), token.get_literal(), token.get_line())
+        for index, token in tape.get_overflow().items()
+    }
+
+    return tape.get_instructions(), overflow, tape.get_lexemes(), tape.get_parameters(), eliminated
+
+
+class ParallelCompiler:
+
+    def __init__(self, source, jobs, qubits=None):
+        """
+        ParallelCompiler constructor.
+        Lexes, parses and compiles a large program in newline aligned chunks across a pool of worker processes.
+
+        :param source: assembly source code (string)
+        :param jobs: number of worker processes (integer)
+        :param qubits: number of qubits in the register, to run the peephole pass over each chunk (integer | None)
+        """
+
+        self._source = source
+        self._jobs = jobs
+        self._qubits = qubits
+
+    def compile(self):
+        """
+        Compiles the chunks in parallel and stitches their tapes back together in order.
+        Tokens never span a newline and each chunk is lexed from its own first line, so chunks lex exactly as they
+        would serially. A chunk boundary that falls inside a statement always leaves a parser error in one of the
+        two chunks, so if no chunk has an error the stitched tape is identical to a serial compilation.
+        If any chunk has an error None is returned, and the caller should run the serial front-end to report the
+        errors exactly as a serial run would.
+        With the peephole pass every chunk but the last ends on a MEASURE, which ends the run of gates of every qubit,
+        so the pass rewrites each chunk exactly as it rewrites that part of the whole program and the stitched tape
+        is still identical to a serial compilation. A program whose MEASUREs are too few to split it compiles in
+        fewer chunks.
+
+        :return: (qasm.compiler.Tape.Tape | None)
+        """
+
+        chunks, lines = self._chunks()
+
+        with ProcessPoolExecutor(self._jobs) as executor:
+            results = list(executor.map(
+                compile_chunk, chunks, lines, [self._qubits] * len(chunks),
+                [index == len(chunks) - 1 for index in range(len(chunks))], [index > 0 for index in range(len(chunks))]
+            ))
+
+        if any(instructions is None for instructions, _, _, _, _ in results):
+            return None
+
+        overflow, lexemes, parameters, offset = {}, {}, {}, 0
+        for instructions, chunk_overflow, chunk_lexemes, chunk_parameters, _ in results:
+            overflow.update((index + offset, token) for index, token in chunk_overflow.items())
+            lexemes.update((index + offset, lexeme) for index, lexeme in chunk_lexemes.items())
+            offset += len(instructions)
+
+            if chunk_parameters:
+                self._renumber(instructions, chunk_parameters, parameters)
+
+        return Tape(
+            numpy.concatenate([instructions for instructions, _, _, _, _ in results]), overflow,
+            parameters=list(parameters), eliminated=sum(eliminated for _, _, _, _, eliminated in results),
+            lexemes=lexemes
+        )
+
+    def _renumber(self, instructions, chunk_parameters, parameters):
+        """
+        Renumbers the parameterised phase shifts of one chunk from the chunk's parameters to the program's
+
+        :param instructions: instructions of the chunk (numpy.ndarray)
+        :param chunk_parameters: names of the parameters of the chunk (list)
+        :param parameters: numbers of the parameters of the program seen so far, keyed by name (dict)
+        :return: (None)
+        """
+
+        numbers = numpy.array(
+            [0] + [parameters.setdefault(name, len(parameters)) + 1 for name in chunk_parameters], dtype=numpy.uint32
+        )
+
+        shifts = instructions["opcode"] == TokenType.R.value
+        instructions["operand"][shifts] = numbers[instructions["operand"][shifts]]
+
+    def _chunks(self):
+        """
+        Splits the source into about four chunks per job (of at least PARALLEL_CHUNK_SIZE characters), each ending on
+        a newline, along with the line number each chunk starts on. With the peephole pass each chunk ends on the
+        first line holding only a MEASURE after its minimum size instead.
+
+        :return: (tuple)
+        """
+
+        source = self._source
+        size = max(PARALLEL_CHUNK_SIZE, len(source) // (self._jobs * 4) + 1)
+        chunks, lines = [], []
+        start, line = 0, 1
+
+        while start < len(source):
+            if self._qubits is None:
+                end = source.find("\n", start + size)
+            else:
+                match = MEASURE_LINE.search(source, start + size)
+                end = match.end() if match else -1
+
+            end = len(source) if end < 0 else end + 1
+
+            chunks.append(source[start:end])
+            lines.append(line)
+
+            line += source.count("\n", start, end)
+            start = end
+
+        return chunks, lines
@@ -0,0 +1,250 @@
+import math
+
+from qasm.parser.Statement import StatementVisitor, PauliX, PhaseShift, SqrtNot, Measure
+from qasm.lexer.TokenType import TokenType
+from qasm.lexer.Token import Token
+
+
+TAU = 2 * math.pi
+
+
+class Peephole(StatementVisitor):
+
+    def __init__(self, statements, qubits, trailing=True, measured=False):
+        """
+        Peephole constructor.
+        Rule based optimisation pass over the statements produced by the parser. Between two MEASUREs the gates on
+        different qubits commute, so each qubit's gates are rewritten as a stack: pairs of X, Y, Z or H cancel,
+        consecutive phase shifts are added modulo 2 pi and two SqrtNOTs become an X.
+        Rewritten statements keep the tokens of the statements they replace, so errors still refer to source lines.
+
+        :param statements: statements produced by the parser (iterable)
+        :param qubits: number of qubits in the register (integer)
+        :param trailing: whether gates after the final MEASURE can be dropped, i.e. whether :param statements ends
+                         the program (boolean)
+        :param measured: whether a MEASURE precedes :param statements in the program, so that with :param trailing
+                         every gate is after the final MEASURE if :param statements has none (boolean)
+        """
+
+        self._statements = statements
+        self._qubits = qubits
+        self._trailing = trailing
+
+        self._optimised = []
+        self._runs = {}
+        self._measure = -1 if measured else None
+
+        self._eliminated = 0
+
+    def optimise(self):
+        """
+        Returns the rewritten statements.
+        Statements whose qubit is out of range are kept as they are and no gate is moved across them, so the bridge
+        executes the same gates before reporting the same error as without the pass. For the same reason trailing
+        phase shifts by a parameter are kept, as the parameter may be unbound.
+
+        :return: (list)
+        """
+
+        gates = 0
+        for statement in self._statements:
+            if not isinstance(statement, Measure):
+                gates += 1
+
+            statement.accept(self)
+
+        if self._trailing and self._measure is not None:
+            for index in range(self._measure + 1, len(self._optimised)):
+                statement = self._optimised[index]
+                if statement is not None and self._is_valid(statement) and not self._is_parameterised(statement):
+                    self._optimised[index] = None
+
+        optimised = [statement for statement in self._optimised if statement is not None]
+        self._eliminated = gates - sum(1 for statement in optimised if not isinstance(statement, Measure))
+
+        return optimised
+
+    def get_eliminated(self):
+        """
+        Returns the number of gates removed by the last call to optimise
+
+        :return: (integer)
+        """
+
+        return self._eliminated
+
+    def visit_pauli_x_statement(self, statement):
+        """
+        Cancels pauli x gate application against a preceding one
+
+        :param statement: (qasm.parser.Statement.PauliX)
+        :return: (None)
+        """
+
+        self._involution(statement)
+
+    def visit_pauli_y_statement(self, statement):
+        """
+        Cancels pauli y gate application against a preceding one
+
+        :param statement: (qasm.parser.Statement.PauliY)
+        :return: (None)
+        """
+
+        self._involution(statement)
+
+    def visit_pauli_z_statement(self, statement):
+        """
+        Cancels pauli z gate application against a preceding one
+
+        :param statement: (qasm.parser.Statement.PauliZ)
+        :return: (None)
+        """
+
+        self._involution(statement)
+
+    def visit_hadamard_statement(self, statement):
+        """
+        Cancels hadamard gate application against a preceding one
+
+        :param statement: (qasm.parser.Statement.Hadamard)
+        :return: (None)
+        """
+
+        self._involution(statement)
+
+    def visit_phase_shift_statement(self, statement):
+        """
+        Adds phase shift gate application to a preceding one, dropping both if the angles add up to 0 modulo 2 pi.
+        Phase shifts by a parameter are not merged.
+
+        :param statement: (qasm.parser.Statement.PhaseShift)
+        :return: (None)
+        """
+
+        previous = self._previous(statement)
+
+        if not isinstance(previous, PhaseShift) or any(map(self._is_parameterised, (previous, statement))):
+            self._push(statement)
+            return
+
+        phi = previous.get_phi()
+        angle = (phi.get_literal() + statement.get_phi().get_literal()) % TAU
+
+        self._pop(statement)
+        if min(angle, TAU - angle) > 1e-12:
+            self._push(PhaseShift([
+                Token(TokenType.NUMBER, repr(angle), angle, phi.get_line()), previous.get_qubit()
+            ]))
+
+    def visit_sqrt_not_statement(self, statement):
+        """
+        Replaces two consecutive sqrt not gate applications with a pauli x gate application
+
+        :param statement: (qasm.parser.Statement.SqrtNot)
+        :return: (None)
+        """
+
+        previous = self._previous(statement)
+
+        if not isinstance(previous, SqrtNot):
+            self._push(statement)
+            return
+
+        self._pop(statement)
+        self._involution(PauliX([previous.get_qubit()]))
+
+    def visit_measure_statement(self, statement):
+        """
+        Ends the current run of gates of every qubit
+
+        :param statement: (qasm.parser.Statement.Measure)
+        :return: (None)
+        """
+
+        self._measure = len(self._optimised)
+        self._barrier(statement)
+
+    def _involution(self, statement):
+        """
+        Cancels :param statement against the preceding gate on its qubit if it is the same gate, otherwise keeps it
+
+        :param statement: (qasm.parser.Statement.Statement)
+        :return: (None)
+        """
+
+        if type(self._previous(statement)) is type(statement):
+            self._pop(statement)
+        else:
+            self._push(statement)
+
+    def _is_valid(self, statement):
+        """
+        Returns whether the qubit operand of gate application :param statement is in range
+
+        :param statement: (qasm.parser.Statement.Statement)
+        :return: (boolean)
+        """
+
+        return 1 <= statement.get_qubit().get_literal() <= self._qubits
+
+    def _is_parameterised(self, statement):
+        """
+        Returns whether :param statement is a phase shift by a parameter
+
+        :param statement: (qasm.parser.Statement.Statement)
+        :return: (boolean)
+        """
+
+        return isinstance(statement, PhaseShift) and statement.get_phi().get_type() == TokenType.PARAMETER
+
+    def _previous(self, statement):
+        """
+        Returns the preceding gate on the qubit of :param statement in the current run, or None
+
+        :param statement: (qasm.parser.Statement.Statement)
+        :return: (qasm.parser.Statement.Statement)
+        """
+
+        if not self._is_valid(statement):
+            return None
+
+        run = self._runs.get(statement.get_qubit().get_literal(), None)
+        return self._optimised[run[-1]] if run else None
+
+    def _push(self, statement):
+        """
+        Appends gate application :param statement to the optimised statements and to the run of its qubit.
+        A gate on an out of range qubit is kept as a barrier instead.
+
+        :param statement: (qasm.parser.Statement.Statement)
+        :return: (None)
+        """
+
+        if not self._is_valid(statement):
+            self._barrier(statement)
+            return
+
+        self._runs.setdefault(statement.get_qubit().get_literal(), []).append(len(self._optimised))
+        self._optimised.append(statement)
+
+    def _pop(self, statement):
+        """
+        Removes the preceding gate on the qubit of :param statement from the optimised statements
+
+        :param statement: (qasm.parser.Statement.Statement)
+        :return: (None)
+        """
+
+        self._optimised[self._runs[statement.get_qubit().get_literal()].pop()] = None
+
+    def _barrier(self, statement):
+        """
+        Appends :param statement to the optimised statements and ends the current run of gates of every qubit
+
+        :param statement: (qasm.parser.Statement.Statement)
+        :return: (None)
+        """
+
+        self._optimised.append(statement)
+        self._runs.clear()
@@ -0,0 +1,183 @@
+import hashlib
+
+import numpy
+
+from qasm.lexer.TokenType import TokenType
+from qasm.lexer.Token import Token
+
+
+TAPE_DTYPE = numpy.dtype([
+    ("opcode", numpy.uint8),
+    ("qubit", numpy.uint32),
+    ("angle", numpy.float64),
+    ("operand", numpy.uint32),
+    ("line", numpy.uint32)
+])
+
+QUBIT_OVERFLOW = numpy.iinfo(numpy.uint32).max
+
+UNITARY = 0
+
+CLASSICAL = [TokenType.X.value, TokenType.Y.value, TokenType.Z.value, TokenType.R.value, TokenType.MEASURE.value]
+
+
+class Tape:
+    """
+    Tape Class
+    Compact instruction tape produced by lowering a list of statements. Each instruction is one row of a NumPy
+    structured array: (opcode, qubit, angle, operand, line), where opcode is the value of the instruction's token
+    type, or UNITARY for a gate produced by an optimisation pass whose matrix is row operand of the unitaries table.
+    A phase shift by a parameter has a non-zero operand: the angle is bound to parameter operand - 1 at execution.
+    """
+
+    def __init__(self, instructions, overflow=None, unitaries=None, parameters=None, eliminated=0, lexemes=None):
+        """
+        Tape constructor
+
+        :param instructions: structured array with dtype TAPE_DTYPE (numpy.ndarray)
+        :param overflow: qubit tokens whose index does not fit in the qubit column, keyed by row (dict)
+        :param unitaries: 2 x 2 matrices of the UNITARY instructions (numpy.ndarray)
+        :param parameters: names of the parameters of the program, in order of first use (list)
+        :param eliminated: number of gates removed by the peephole pass before the program was lowered (integer)
+        :param lexemes: source text of the qubit operands not written as q<index> (e.g. q007), keyed by row (dict)
+        """
+
+        self._instructions = instructions
+        self._overflow = overflow or {}
+        self._unitaries = unitaries if unitaries is not None else numpy.empty((0, 2, 2), dtype=numpy.complex128)
+        self._parameters = parameters or []
+        self._eliminated = eliminated
+        self._lexemes = lexemes or {}
+
+    def get_instructions(self):
+        """
+        Returns the instruction array
+
+        :return: (numpy.ndarray)
+        """
+
+        return self._instructions
+
+    def get_overflow(self):
+        """
+        Returns the qubit tokens whose index does not fit in the qubit column, keyed by row
+
+        :return: (dict)
+        """
+
+        return self._overflow
+
+    def get_lexemes(self):
+        """
+        Returns the source text of the qubit operands not written as q<index>, keyed by row
+
+        :return: (dict)
+        """
+
+        return self._lexemes
+
+    def get_unitaries(self):
+        """
+        Returns the matrices of the UNITARY instructions, indexed by their operand
+
+        :return: (numpy.ndarray)
+        """
+
+        return self._unitaries
+
+    def get_digest(self):
+        """
+        Returns a hash of the instructions, unitaries and parameter names, which identifies the instruction stream
+        that an index into the tape refers to
+
+        :return: (string)
+        """
+
+        digest = hashlib.sha256(self._instructions.tobytes())
+        digest.update(self._unitaries.tobytes())
+        digest.update("\0".join(self._parameters).encode("utf-8"))
+
+        return digest.hexdigest()
+
+    def get_parameters(self):
+        """
+        Returns the names of the parameters, indexed by the operand of a parameterised phase shift minus one
+
+        :return: (list)
+        """
+
+        return self._parameters
+
+    def get_eliminated(self):
+        """
+        Returns the number of gates removed by the peephole pass before the program was lowered to the tape
+
+        :return: (integer)
+        """
+
+        return self._eliminated
+
+    def get_parameter(self, index):
+        """
+        Returns a parameter token for the parameterised phase shift at :param index, for error reporting
+
+        :param index: (integer)
+        :return: (qasm.lexer.Token.Token)
+        """
+
+        instruction = self._instructions[index]
+        name = self._parameters[int(instruction["operand"]) - 1]
+
+        return Token(TokenType.PARAMETER, name, name, int(instruction["line"]))
+
+    def is_classical(self):
+        """
+        Returns whether the program never leaves a computational basis state (up to a global phase), i.e. it only
+        applies X, Y, Z and R gates, so every measurement is deterministic
+
+        :return: (boolean)
+        """
+
+        return bool(numpy.isin(self._instructions["opcode"], CLASSICAL).all())
+
+    def get_qubit(self, index):
+        """
+        Returns a qubit token for the instruction at :param index, for error reporting
+
+        :param index: (integer)
+        :return: (qasm.lexer.Token.Token)
+        """
+
+        if index in self._overflow:
+            return self._overflow[index]
+
+        instruction = self._instructions[index]
+        qubit = int(instruction["qubit"])
+
+        lexeme = self._lexemes.get(index, None) or "q{0}".format(qubit)
+
+        return Token(TokenType.QUBIT, lexeme, qubit, int(instruction["line"]))
+
+    def __len__(self):
+        """
+        Returns the number of instructions on the tape
+
+        :return: (integer)
+        """
+
+        return len(self._instructions)
+
+    def __repr__(self):
+        """
+        Returns string representation of the tape
+
+        :return: (string)
+        """
+
+        return "\n".join(
+            "{0} q{1} {2} (line {3})".format(
+                "U{0}".format(operand) if opcode == UNITARY else TokenType(opcode).name, qubit,
+                self._parameters[operand - 1] if opcode == TokenType.R.value and operand else angle, line
+            )
+            for opcode, qubit, angle, operand, line in self._instructions.tolist()
+        )
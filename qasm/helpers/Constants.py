@@ -7,7 +7,80 @@ separator = "\\" if OS == "nt" else "/"
 SYNTAX_JSON = os.path.join(ROOT, "parser{0}syntax.json".format(separator))
 COMMANDS_JSON = os.path.join(ROOT, "commands.json")
 QC_CONFIG = os.path.join(ROOT, "bridge{0}config{0}config.json".format(separator))
+CACHE_DIRECTORY = os.path.join(ROOT, "__qasmcache__")
+USER_CACHE_ROOT = os.environ.get("LOCALAPPDATA" if OS == "nt" else "XDG_CACHE_HOME") or os.path.join(
+    os.path.expanduser("~"), ".cache"
+)
+USER_CACHE_DIRECTORY = os.path.join(USER_CACHE_ROOT, "qasm")
+CHECKPOINT_DIRECTORY = os.path.join(ROOT, "__qasmcheckpoint__")
+USER_CHECKPOINT_DIRECTORY = os.path.join(USER_CACHE_DIRECTORY, "checkpoints")
 
+CACHE_SIZE = 1 << 28
+
+SPARSE_TOLERANCE = 1e-12
+
+MEMMAP_CHUNK_SIZE = 1 << 20
+
+THREAD_THRESHOLD = 1 << 18
+
+SHARED_PARTITION_SIZE = 1 << 16
+
+ALIAS_RATIO = 8
+
+GATE_CACHE_SIZE = 1 << 12
+GATE_ANGLE_SCALE = 1 << 40
+
+SINK_BUFFER_SIZE = 1 << 12
+NPY_HEADER_SIZE = 256
+
+PRECISIONS = {
+    "single": "complex64",
+    "double": "complex128"
+}
+
+NORM_TOLERANCE = {
+    "single": 1e-4,
+    "double": 1e-10
+}
+
+
+BACKENDS = {
+    "external": ("quantum_computer", "Computer"),
+    "statevector": ("qasm.bridge.computer.StatevectorComputer", "StatevectorComputer"),
+    "sparse": ("qasm.bridge.computer.SparseComputer", "SparseComputer"),
+    "product": ("qasm.bridge.computer.ProductComputer", "ProductComputer"),
+    "classical": ("qasm.bridge.computer.ClassicalComputer", "ClassicalComputer"),
+    "memmap": ("qasm.bridge.computer.MemmapComputer", "MemmapComputer"),
+    "shared": ("qasm.bridge.computer.SharedComputer", "SharedComputer")
+}
+
+SELECTABLE_BACKENDS = [backend for backend in BACKENDS if backend != "classical"]
+
+SINKS = {
+    "text": ("qasm.bridge.sink.TextSink", "TextSink", {}),
+    "jsonl": ("qasm.bridge.sink.JsonSink", "JsonSink", {}),
+    "raw": ("qasm.bridge.sink.BinarySink", "BinarySink", {"header": False}),
+    "npy": ("qasm.bridge.sink.BinarySink", "BinarySink", {"header": True})
+}
 
 INTEGER_REGEX = r"^(\d+)$"
-QUBITS_REGEX = r"^(\d{1,2})$"
\ No newline at end of file
+QUBITS_REGEX = r"^(\d{1,2})$"
+SWEEP_REGEX = r"^(\w+)=([^:]+)(?::([^:]+):([1-9]\d*))?$"
+OUTPUT_REGEX = r"^(\w+)(?::(.+))?$"
+OBSERVATION_REGEX = r"\|([01]+)>$"
+
+LEXER_CHUNK_SIZE = 1 << 16
+PARALLEL_CHUNK_SIZE = 1 << 20
+
+TOKEN_REGEX = (
+    r"[ \r\t]*(?:"
+    r"(?P<NEWLINE>\n)"
+    r"|(?P<SKIP>;[^\n]*|\Z)"
+    r"|(?P<COMMA>,)"
+    r"|(?P<QUBIT>q[0-9]*)(?![0-9]|[^\x00-\x7f])"
+    r"|(?P<NUMBER>[0-9]+(?:\.[0-9]+)?)(?![0-9]|\.[0-9]|\.?[^\x00-\x7f])"
+    r"|(?P<INSTRUCTION>[A-Za-pr-z][A-Za-z0-9]*)(?![A-Za-z0-9]|[^\x00-\x7f])"
+    r"|(?P<UNEXPECTED>[\x00-\x2f\x3a-\x40\x5b-\x60\x7b-\x7f])"
+    r"|(?P<FALLBACK>[\s\S])"
+    r")"
+)
\ No newline at end of file
@@ -2,3 +2,9 @@ class QASMConfigException(Exception):
 
     def __str__(self):
         return "[ERROR] Error: QASMConfigError, Response: {0}".format(super().__str__())
+
+
+class QASMArgumentException(Exception):
+
+    def __str__(self):
+        return "[ERROR] Error: QASMArgumentError, Response: {0}".format(super().__str__())
@@ -1,4 +1,5 @@
 import sys
+import os
 
 
 def read_file(file_location):
@@ -30,6 +31,27 @@ def write_file(file_location, data):
         file.write(data)
 
 
+def writable_directory(*directories):
+    """
+    Returns the first of :param directories that exists (or can be created) and can be written to, or the last one
+    if none can, e.g. when the installed package is read-only
+
+    :param directories: absolute paths of the candidate directories (strings)
+    :return: (string)
+    """
+
+    for directory in directories:
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError:
+            continue
+
+        if os.access(directory, os.W_OK):
+            return directory
+
+    return directories[-1]
+
+
 class SortedDictionary:
     """
     SortedDictionary Class
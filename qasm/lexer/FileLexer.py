@@ -0,0 +1,117 @@
+import mmap
+import os
+
+from qasm.lexer.TokenType import TokenType
+from qasm.helpers.Constants import LEXER_CHUNK_SIZE
+from qasm.lexer.Lexer import Lexer
+from qasm.lexer.Token import Token
+
+
+class FileLexer(Lexer):
+
+    def __init__(self, file):
+        """
+        File lexer constructor.
+        Memory-maps the program instead of reading it into a string. Tokens are produced lazily by iter_tokens, so
+        peak memory is bounded by LEXER_CHUNK_SIZE rather than by the size of the program.
+
+        :param file: path of the program or a binary file object (string | file)
+        """
+
+        self._file = open(file, "rb") if isinstance(file, (str, os.PathLike)) else None
+        self._buffer = self._map(self._file or file)
+
+        super().__init__(self._buffer)
+
+    def _map(self, file):
+        """
+        Memory-maps :param file. Empty files and file objects that cannot be mapped (e.g. io.BytesIO) are read
+        instead.
+
+        :param file: binary file object (file)
+        :return: (mmap.mmap | bytes)
+        """
+
+        try:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError):
+            return file.read()
+
+    def scan_tokens(self):
+        """
+        Performs lexical analysis on the whole file to produce a list of tokens with a End Of File token at the
+        end of the list.
+
+        :return: (list)
+        """
+
+        return list(self.iter_tokens())
+
+    def iter_tokens(self):
+        """
+        Lazily performs lexical analysis on the file, yielding tokens followed by a End Of File token.
+        The file is decoded and scanned in newline aligned chunks; tokens never span a newline so chunk boundaries
+        do not change the tokens produced. Line endings are translated as they would be by read_file.
+
+        :return: (generator)
+        """
+
+        try:
+            for chunk in self._chunks():
+                if "\r" in chunk:
+                    chunk = chunk.replace("\r\n", "\n").replace("\r", "\n")
+
+                self._source, self._tokens = chunk, []
+                self._scan()
+                yield from self._tokens
+
+            self._tokens = []
+            yield Token(TokenType.EOF, "", None, self._line)
+        finally:
+            self.close()
+
+    def _chunks(self):
+        """
+        Yields the decoded contents of the file in chunks of roughly LEXER_CHUNK_SIZE bytes, each ending on a newline
+        (except possibly the last).
+
+        :return: (generator)
+        """
+
+        buffer = self._buffer
+        size = len(buffer)
+        start = 0
+
+        while start < size:
+            end = start + LEXER_CHUNK_SIZE
+            if end < size:
+                newline = buffer.rfind(b"\n", start, end)
+                if newline < 0:
+                    newline = buffer.find(b"\n", end)
+
+                end = size if newline < 0 else newline + 1
+            else:
+                end = size
+
+            yield buffer[start:end].decode("utf-8")
+            start = end
+
+    def close(self):
+        """
+        Releases the memory map, and the file if it was opened by the lexer
+
+        :return: (None)
+        """
+
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *arguments):
+        self.close()
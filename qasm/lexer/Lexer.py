@@ -1,27 +1,36 @@
 import re as regular_expression
 
 from qasm.lexer.TokenType import TokenType, KEYWORDS
-from qasm.helpers.Constants import INTEGER_REGEX
+from qasm.helpers.Constants import INTEGER_REGEX, TOKEN_REGEX
+from qasm.lexer.TokenBuffer import TokenBuffer
 from qasm.error.LexerError import LexerError
 from qasm.lexer.Token import Token
 
 
+TOKEN_PATTERN = regular_expression.compile(TOKEN_REGEX)
+
+
 class Lexer:
 
-    def __init__(self, source):
+    def __init__(self, source, legacy=False, line=1):
         """
         Lexer constructor
 
         :param source: assembly source code (string)
+        :param legacy: use the character-at-a-time scanner instead of the compiled master pattern (boolean)
+        :param line: line number of the first line of :param source, when lexing part of a program (integer)
         """
 
         self._source = source
+        self._legacy = legacy
         self._tokens = []
         self._errors = []
+        self._emit = self._append_token
 
         self._start = 0
         self._current = 0
-        self._line = 1
+        self._line = line
+        self._angle = False
 
         if not self._source:
             self._error("File is empty", self._peek())
@@ -34,13 +43,37 @@ class Lexer:
         :return: (list)
         """
 
-        while not self._is_at_end():
-            self._start = self._current
-            self._scan_token()
+        self._emit = self._append_token
+        self._scan_source()
 
         self._tokens.append(Token(TokenType.EOF, "", None, self._line))
         return self._tokens
 
+    def iter_tokens(self):
+        """
+        Yields the tokens produced by lexical analysis, ending with a End Of File token
+
+        :return: (iterator)
+        """
+
+        return iter(self.scan_tokens())
+
+    def scan_buffer(self):
+        """
+        Performs lexical analysis on the source code to produce a compact token buffer with a End Of File token at
+        the end of the buffer. Lexemes are not copied out of the source.
+
+        :return: (qasm.lexer.TokenBuffer.TokenBuffer)
+        """
+
+        buffer = TokenBuffer(self._source)
+
+        self._emit = buffer.append
+        self._scan_source()
+
+        buffer.append(TokenType.EOF, len(self._source), len(self._source), None, self._line)
+        return buffer
+
     def get_errors(self):
         """
         Fetches internal lexer errors
@@ -50,6 +83,89 @@ class Lexer:
 
         return self._errors
 
+    def _scan_source(self):
+        """
+        Scans the whole source with the selected scanner
+
+        :return: (None)
+        """
+
+        if self._legacy:
+            while not self._is_at_end():
+                self._start = self._current
+                self._scan_token()
+        else:
+            self._scan()
+
+    def _scan(self):
+        """
+        Performs lexical analysis using the compiled master pattern (see TOKEN_REGEX), matching one whole token,
+        whitespace run or comment per step. Anything the pattern cannot classify on its own (e.g. non-ascii
+        characters) is handed to the character-at-a-time scanner for the remainder of that line, so the tokens and
+        errors produced are identical to the legacy scanner.
+
+        :return: (None)
+        """
+
+        source = self._source
+        emit = self._emit
+        line = self._line
+        angle = self._angle
+        length = len(source)
+        resume = 0
+
+        for token in TOKEN_PATTERN.finditer(source):
+            kind = token.lastgroup
+            position, end = token.span(kind)
+
+            if position < resume:
+                continue
+            elif kind == "SKIP":
+                pass
+            elif kind == "NEWLINE":
+                line += 1
+            elif kind == "QUBIT":
+                if end - position > 1:
+                    emit(TokenType.QUBIT, position, end, int(source[position + 1:end]), line)
+                    angle = False
+                else:
+                    self._errors.append(
+                        LexerError(line, "Invalid integer format", source[end] if end < length else "\0")
+                    )
+            elif kind == "NUMBER":
+                emit(TokenType.NUMBER, position, end, float(source[position:end]), line)
+                angle = False
+            elif kind == "COMMA":
+                emit(TokenType.COMMA, position, end, None, line)
+                angle = False
+            elif kind == "INSTRUCTION":
+                lexeme = source[position:end]
+                type = KEYWORDS.get(lexeme, None)
+                if type:
+                    emit(type, position, end, lexeme, line)
+                    angle = type is TokenType.R
+                elif angle and lexeme[0].islower():
+                    emit(TokenType.PARAMETER, position, end, lexeme, line)
+                    angle = False
+                else:
+                    self._errors.append(LexerError(line, "Invalid instruction", lexeme))
+            elif kind == "UNEXPECTED":
+                self._errors.append(LexerError(line, "Unexpected character", source[position]))
+            else:
+                resume = source.find("\n", position)
+                if resume < 0:
+                    resume = length
+
+                self._line, self._current, self._angle = line, position, angle
+                while self._current < resume:
+                    self._start = self._current
+                    self._scan_token()
+
+                angle = self._angle
+
+        self._line, self._angle = line, angle
+        self._start = self._current = length
+
     def _case(self, character, comparable_character):
         """
         Helper method; used to mimic switch-case statement comparisons. e.g. java
@@ -146,8 +262,10 @@ class Lexer:
 
     def _instruction(self):
         """
-        Method used to handle the creation of an instruction.
-        Literal contains string representation of the instruction
+        Method used to handle the creation of an instruction or a parameter.
+        Literal contains string representation of the instruction.
+        Identifiers that are not instructions, start with a lower case letter (other than q) and follow a phase shift
+        instruction are parameters, e.g. theta in R theta, q1; anywhere else they are invalid instructions.
 
         :return: (None)
         """
@@ -157,6 +275,8 @@ class Lexer:
 
         literal = self._source[self._start: self._current]
         type = KEYWORDS.get(literal, None)
+        if not type and self._angle and literal[0].islower():
+            type = TokenType.PARAMETER
         if not type:
             self._error("Invalid instruction", literal)
             return
@@ -174,17 +294,31 @@ class Lexer:
         self._add_token_literal(type, None)
 
     def _add_token_literal(self, type, literal):
+        """
+        Method that emits a token spanning the start and current pointers.
+
+        :param type: token type (qasm.lexer.TokenType.TokenType)
+        :param literal: literal of the token
+        :return: (None)
+        """
+
+        self._emit(type, self._start, self._current, literal, self._line)
+        self._angle = type is TokenType.R
+
+    def _append_token(self, type, start, end, literal, line):
         """
         Method that appends a token to the tokens list.
-        Parses lexeme from source using start and current pointers.
+        Parses lexeme from source using :param start and :param end.
 
         :param type: token type (qasm.lexer.TokenType.TokenType)
+        :param start: offset of the first character of the lexeme (integer)
+        :param end: offset after the last character of the lexeme (integer)
         :param literal: literal of the token
+        :param line: (integer)
         :return: (None)
         """
 
-        lexeme = self._source[self._start : self._current]
-        self._tokens.append(Token(type, lexeme, literal, self._line))
+        self._tokens.append(Token(type, self._source[start:end], literal, line))
 
     def _is_digit(self, character):
         """
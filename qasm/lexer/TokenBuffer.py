@@ -0,0 +1,216 @@
+from array import array
+
+from qasm.lexer.TokenType import TokenType
+
+
+TYPES = {type.value: type for type in TokenType}
+
+QUBIT_OVERFLOW = (1 << 63) - 1
+
+
+class TokenBuffer:
+    """
+    TokenBuffer Class
+    Compact, column oriented store for the tokens of one source. Each token costs a type code, start and end offsets,
+    a line, a qubit index and a number literal (~41 bytes) instead of a full qasm.lexer.Token.Token object. Lexemes
+    are only sliced from the source when they are asked for, e.g. when an error is reported.
+    Qubit indices are kept exact in an integer column; an index that does not fit is stored as QUBIT_OVERFLOW, which
+    is out of range of any register, so the bridge still reports it (with its lexeme).
+    """
+
+    def __init__(self, source):
+        """
+        TokenBuffer constructor
+
+        :param source: source code the offsets refer to (string)
+        """
+
+        self._source = source
+
+        self._types = array("B")
+        self._starts = array("Q")
+        self._ends = array("Q")
+        self._lines = array("L")
+        self._qubits = array("q")
+        self._numbers = array("d")
+
+    def append(self, type, start, end, literal, line):
+        """
+        Appends a token to the buffer.
+        Qubit indices and number literals are stored; any other literal is recovered from the lexeme when it is asked
+        for.
+
+        :param type: token type (qasm.lexer.TokenType.TokenType)
+        :param start: offset of the first character of the lexeme (integer)
+        :param end: offset after the last character of the lexeme (integer)
+        :param literal: literal of the token
+        :param line: (integer)
+        :return: (None)
+        """
+
+        self._types.append(type._value_)
+        self._starts.append(start)
+        self._ends.append(end)
+        self._lines.append(line)
+        self._qubits.append(min(literal, QUBIT_OVERFLOW) if type is TokenType.QUBIT else 0)
+        self._numbers.append(literal if type is TokenType.NUMBER else 0.0)
+
+    def get_type(self, index):
+        """
+        Returns the type of the token at :param index
+
+        :param index: (integer)
+        :return: (qasm.lexer.TokenType.TokenType)
+        """
+
+        return TYPES[self._types[index]]
+
+    def get_lexeme(self, index):
+        """
+        Slices the lexeme of the token at :param index from the source
+
+        :param index: (integer)
+        :return: (string)
+        """
+
+        return self._source[self._starts[index]:self._ends[index]]
+
+    def get_literal(self, index):
+        """
+        Returns the literal of the token at :param index
+
+        :param index: (integer)
+        :return:
+        """
+
+        type = TYPES[self._types[index]]
+        if type is TokenType.QUBIT:
+            return self._qubits[index]
+        if type is TokenType.NUMBER:
+            return self._numbers[index]
+        if type is TokenType.COMMA or type is TokenType.EOF:
+            return None
+
+        return self.get_lexeme(index)
+
+    def get_line(self, index):
+        """
+        Returns the line of the token at :param index
+
+        :param index: (integer)
+        :return: (integer)
+        """
+
+        return self._lines[index]
+
+    def __getitem__(self, index):
+        """
+        Returns a lightweight token view of the token at :param index.
+        If :param index is out of range -> IndexError raised.
+
+        :param index: (integer)
+        :return: (qasm.lexer.TokenBuffer.BufferToken)
+        """
+
+        if index < 0:
+            index += len(self._types)
+
+        if not 0 <= index < len(self._types):
+            raise IndexError("Token index out of range")
+
+        return BufferToken(self, index)
+
+    def __iter__(self):
+        """
+        Yields a token view of each token in the buffer
+
+        :return: (generator)
+        """
+
+        for index in range(len(self._types)):
+            yield BufferToken(self, index)
+
+    def __len__(self):
+        """
+        Returns the number of tokens in the buffer
+
+        :return: (integer)
+        """
+
+        return len(self._types)
+
+
+class BufferToken:
+    """
+    BufferToken Class
+    View of a single token stored in a TokenBuffer. Provides the same interface as qasm.lexer.Token.Token.
+    """
+
+    __slots__ = ("_buffer", "_index")
+
+    def __init__(self, buffer, index):
+        """
+        BufferToken constructor
+
+        :param buffer: buffer holding the token (qasm.lexer.TokenBuffer.TokenBuffer)
+        :param index: index of the token in :param buffer (integer)
+        """
+
+        self._buffer = buffer
+        self._index = index
+
+    def get_type(self):
+        """
+        Returns the token type
+
+        :return: (qasm.lexer.TokenType.TokenType)
+        """
+
+        return self._buffer.get_type(self._index)
+
+    def get_lexeme(self):
+        """
+        Return the string representation of the token
+
+        :return: (string)
+        """
+
+        return self._buffer.get_lexeme(self._index)
+
+    def get_literal(self):
+        """
+        Returns literal of the token
+
+        :return:
+        """
+
+        return self._buffer.get_literal(self._index)
+
+    def get_line(self):
+        """
+        Returns the line of the token
+
+        :return: (integer)
+        """
+
+        return self._buffer.get_line(self._index)
+
+    def __str__(self):
+        """
+        Returns user friendly string representation of the token object
+
+        :return: (string)
+        """
+
+        return self.get_lexeme()
+
+    def __repr__(self):
+        """
+        Returns the string representation of the token object (Debug)
+
+        :return: (string)
+        """
+
+        return "(Type: {0}, Lexeme: {1}, Literal: {2})".format(
+            self.get_type(), self.get_lexeme(), self.get_literal()
+        )
@@ -17,6 +17,8 @@ class TokenType(Enumerate):
     SQRT_NOT = 10
     MEASURE = 11
 
+    PARAMETER = 12
+
 
 KEYWORDS = {
     "X": TokenType.X,
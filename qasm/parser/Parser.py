@@ -1,9 +1,7 @@
-import json
-
-from qasm.lexer.TokenType import TokenType, STATEMENTS
-from qasm.helpers.Constants import SYNTAX_JSON
+from qasm.lexer.TokenType import TokenType
+from qasm.lexer.TokenBuffer import TokenBuffer
 from qasm.error.ParseError import ParseError
-from qasm.helpers.Util import read_file
+from qasm.parser.Syntax import Syntax
 
 
 class Parser:
@@ -12,13 +10,22 @@ class Parser:
         """
         Parser (syntactic analyser) constructor
 
-        :param tokens: list containing tokens produced from lexical analysis (list)
+        The parser only ever looks at the current and previous token, so :param tokens may be any iterable of
+        tokens ending with a End Of File token, including a generator such as FileLexer.iter_tokens.
+        A TokenBuffer is read by index instead: token types are read from its type column and token views are only
+        made for the tokens kept in statements.
+
+        :param tokens: tokens produced from lexical analysis (qasm.lexer.TokenBuffer.TokenBuffer | iterable)
         """
 
+        self._buffer = tokens if isinstance(tokens, TokenBuffer) else None
         self._current = 0
-        self._tokens = tokens
 
-        self._syntax = self._read_syntax()
+        self._tokens = None if self._buffer is not None else iter(tokens)
+        self._current_token = None if self._buffer is not None else next(self._tokens)
+        self._previous_token = None
+
+        self._rules = Syntax.get_rules()
         self._errors = []
 
     def get_errors(self):
@@ -30,19 +37,6 @@ class Parser:
 
         return self._errors
 
-    def _read_syntax(self):
-        """
-        Returns syntax conditions stored in syntax.json.
-        Converts keys from string to integer.
-
-        :return: (dict)
-        """
-
-        return {
-            int(key): value for key, value
-            in json.loads(read_file(SYNTAX_JSON)).items()
-        }
-
     def parse(self):
         """
         Performs syntactic analysis on the tokens to produce a list of statements.
@@ -57,58 +51,76 @@ class Parser:
 
         return statements
 
+    def iter_statements(self):
+        """
+        Lazily performs syntactic analysis on the tokens, yielding each statement as soon as it is parsed.
+        Statements that fail to parse are recorded in the internal errors list and skipped.
+
+        :return: (generator)
+        """
+
+        while not self._is_at_end():
+            statement = self._statement()
+            if statement is not None:
+                yield statement
+
     def _statement(self):
         """
         Parses tokens to statement.
-        Uses syntax conditions stored in syntax.json to parse tokens to valid statements.
+        Looks up the compiled syntax rule for the current instruction token to parse tokens to valid statements.
         If an unexpected token is discovered then a parser error is raised.
 
         :return: (qasm.parser.Statement.Statement)
         """
 
         try:
-            if self._match(TokenType.MEASURE):
-                return STATEMENTS[11](self._previous())
-
-            for type in self._syntax.keys():
-                   if self._match(TokenType(type)):
-                       return self._instruction(type)
+            rule = self._rules.get(self._peek_type(), None)
+            if rule is None:
+                raise self._error(self._peek(), "Unexpected token")
 
-            raise self._error(self._peek(), "Unexpected token")
+            self._move()
+            return self._instruction(rule)
         except ParseError:
             self._synchronise()
             return None
 
-    def _instruction(self, type):
+    def _instruction(self, rule):
         """
-        Uses syntax conditions for :param type to parse current tokens to statement.
+        Uses the operand patterns of :param rule to parse current tokens to statement.
+        Statements without operands (MEASURE) are given the instruction token instead.
         If unexpected token is discovered then a parser error is raised.
 
-        :param type: token type (integer)
+        :param rule: statement class and operand patterns (tuple)
         :return: (qasm.parser.Statement.Statement)
         """
 
+        statement, operands = rule
+        if not operands:
+            return statement([self._previous()])
+
         tokens = []
 
-        for token in self._syntax[type]:
-            if TokenType(token["Type"]) == TokenType.COMMA:
-                self._consume(TokenType.COMMA, token["Error"])
-            else:
-                tokens.append(self._consume(TokenType(token["Type"]), token["Error"]))
+        for types, message, keep in operands:
+            token = self._consume(types, message, keep)
+            if keep:
+                tokens.append(token)
 
-        return STATEMENTS[type](tokens)
+        return statement(tokens)
 
-    def _consume(self, type, message):
+    def _consume(self, types, message, keep=True):
         """
-        Consumes current token if expected token is found, otherwise raise parser error
+        Consumes current token if one of the expected token types is found, otherwise raise parser error.
+        Returns the consumed token, or None unless :param keep.
 
-        :param type: expected token type (qasm.lexer.TokenType.TokenType)
+        :param types: expected token types (frozenset)
         :param message: error message (string)
+        :param keep: whether the token is returned (boolean)
         :return: (qasm.lexer.Token.Token)
         """
 
-        if self._check(type):
-            return self._move()
+        if self._peek_type() in types:
+            self._move()
+            return self._previous() if keep else None
 
         raise self._error(self._peek(), message)
 
@@ -139,20 +151,21 @@ class Parser:
         if self._is_at_end():
             return False
 
-        return self._peek().get_type() == type
+        return self._peek_type() == type
 
     def _move(self):
         """
-        Increments current pointer for tokens list, if not at the end of tokens list.
-        Returns the previous token.
+        Advances to the next token, if not at the end of the tokens.
 
-        :return: (qasm.lexer.Token.Token)
+        :return: (None)
         """
 
         if not self._is_at_end():
-            self._current += 1
-
-        return self._previous()
+            if self._buffer is not None:
+                self._current += 1
+            else:
+                self._previous_token = self._current_token
+                self._current_token = next(self._tokens)
 
     def _error(self, token, message):
         """
@@ -174,7 +187,22 @@ class Parser:
         :return: (qasm.lexer.Token.Token)
         """
 
-        return self._tokens[self._current]
+        if self._buffer is not None:
+            return self._buffer[self._current]
+
+        return self._current_token
+
+    def _peek_type(self):
+        """
+        Returns the type of the current token
+
+        :return: (qasm.lexer.TokenType.TokenType)
+        """
+
+        if self._buffer is not None:
+            return self._buffer.get_type(self._current)
+
+        return self._current_token.get_type()
 
     def _previous(self):
         """
@@ -183,16 +211,19 @@ class Parser:
         :return: (qasm.lexer.Token.Token)
         """
 
-        return self._tokens[self._current - 1]
+        if self._buffer is not None:
+            return self._buffer[self._current - 1]
+
+        return self._previous_token
 
     def _is_at_end(self):
         """
-        Returns whether the parser is at the end of the tokens list.
+        Returns whether the parser is at the End Of File token.
 
         :return: (boolean)
         """
 
-        return self._peek().get_type() == TokenType.EOF
+        return self._peek_type() == TokenType.EOF
 
     def _synchronise(self):
         """
@@ -205,9 +236,10 @@ class Parser:
         self._move()
 
         while not self._is_at_end():
-            if self._peek().get_type() not in [
+            if self._peek_type() not in [
                 TokenType.QUBIT,
                 TokenType.NUMBER,
+                TokenType.PARAMETER,
                 TokenType.COMMA
             ]:
                 return
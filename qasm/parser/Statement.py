@@ -308,9 +308,20 @@ class Measure(Statement):
     def __init__(self, tokens):
         """
         Measure statement constructor
+
+        :param tokens: measure instruction token (|tokens|=1) (list)
         """
 
-        pass
+        self._instruction, = tokens
+
+    def get_instruction(self):
+        """
+        Returns the measure instruction token
+
+        :return: (qasm.lexer.Token.Token)
+        """
+
+        return self._instruction
 
     def accept(self, visitor):
         """
@@ -0,0 +1,70 @@
+import json
+
+from qasm.lexer.TokenType import TokenType, STATEMENTS
+from qasm.helpers.Constants import SYNTAX_JSON
+from qasm.helpers.Util import read_file
+
+
+class Syntax:
+    """
+    Syntax Class
+    Grammar of the assembler, compiled from syntax.json once per process.
+    """
+
+    _rules = None
+
+    @staticmethod
+    def get_rules():
+        """
+        Returns the compiled syntax rules, reading syntax.json on first use.
+        Rules are keyed by instruction token type. Each rule holds the statement class and the operand patterns
+        (expected token types, error message, whether the operand is kept) with the types already resolved.
+        The "Type" of an operand in syntax.json is either one token type or a list of token types.
+
+        :return: (dict)
+        """
+
+        if Syntax._rules is None:
+            Syntax._rules = Syntax._compile(json.loads(read_file(SYNTAX_JSON)))
+
+        return Syntax._rules
+
+    @staticmethod
+    def _compile(syntax):
+        """
+        Compiles the syntax conditions stored in :param syntax into rules
+
+        :param syntax: syntax conditions, keyed by instruction token type (dict)
+        :return: (dict)
+        """
+
+        rules = {
+            TokenType.MEASURE: (STATEMENTS[TokenType.MEASURE.value], ())
+        }
+
+        for key, operands in syntax.items():
+            type = TokenType(int(key))
+            rules[type] = (
+                STATEMENTS[type.value],
+                tuple(
+                    (types, operand["Error"], TokenType.COMMA not in types)
+                    for operand, types in zip(operands, map(Syntax._types, operands))
+                )
+            )
+
+        return rules
+
+    @staticmethod
+    def _types(operand):
+        """
+        Returns the token types accepted by :param operand
+
+        :param operand: operand syntax condition (dict)
+        :return: (frozenset)
+        """
+
+        types = operand["Type"]
+        if not isinstance(types, list):
+            types = [types]
+
+        return frozenset(map(TokenType, types))
@@ -11,7 +11,10 @@ packages = [
     "qasm",
     "qasm.bridge",
     "qasm.bridge.config",
+    "qasm.bridge.computer",
+    "qasm.bridge.sink",
     "qasm.parser",
+    "qasm.compiler",
     "qasm.lexer",
     "qasm.helpers",
     "qasm.error",